@@ -2,37 +2,189 @@
 """
 acr122u_reader.py
 
-Compatibility stub used when ACR122U wrapper was present earlier in the repo.
-This module is intentionally minimal now and acts like a no-op wrapper to avoid
-errors if still imported. It's recommended to remove calls to this module if you
-do not use ACR122U-specific behavior.
+Thin wrapper around whichever ACR122U userspace library happens to be
+installed (acr122u / py_acr122u / pyacr122u). The libraries expose slightly
+different APIs, so `connect()` probes the device object once for a usable
+UID-read method and caches a bound reader function; `get_uid()` then just
+invokes the cached function instead of re-walking hasattr candidates on
+every poll.
+
+All methods are best-effort: if no backing library or reader is available
+the wrapper degrades to a no-op so importing this module never breaks app.py.
 """
-from typing import Optional
+from importlib.util import find_spec
+from typing import Callable, Optional
+import importlib
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Backing library shared by all wrapper instances.
+# None = not probed yet, False = probe failed (negative cache).
+_CACHED_LIB = None
+_IMPORT_LOCK = threading.Lock()
+
+# APDU understood by ACR122U-class readers to return the card UID
+_GET_UID_APDU = [0xFF, 0xCA, 0x00, 0x00, 0x00]
+
+
+def _import_lib():
+    """Import the first available ACR122U library and cache the result."""
+    global _CACHED_LIB
+
+    if _CACHED_LIB is not None:
+        return _CACHED_LIB or None
+
+    with _IMPORT_LOCK:
+        # Re-check after acquiring the lock: another thread may have finished
+        # the probe while we were waiting, and repeating it would import the
+        # library twice (double-checked locking).
+        if _CACHED_LIB is not None:
+            return _CACHED_LIB or None
+
+        for name in ('acr122u', 'py_acr122u', 'pyacr122u'):
+            try:
+                # find_spec rejects missing names without constructing an
+                # ImportError or re-walking sys.path exception-style
+                if find_spec(name) is None:
+                    continue
+                lib = importlib.import_module(name)
+                _CACHED_LIB = lib
+                logger.debug('Using ACR122U library: %s', name)
+                return lib
+            except Exception:
+                continue
+        _CACHED_LIB = False
+        logger.debug('No ACR122U library available')
+        return None
+
+
+def _decode_uid(res) -> Optional[str]:
+    """Normalize a library read result to an uppercase hex UID string."""
+    if res is None:
+        return None
+    if isinstance(res, str):
+        return res.upper() or None
+    if isinstance(res, (bytes, bytearray, list, tuple)):
+        if not res:
+            return None
+        # Single C-level conversion instead of a per-byte format loop
+        return bytes(res).hex().upper()
+    return None
+
 
 class ACR122UWrapper:
+    """Adapter exposing connect()/get_uid()/close() over the detected library."""
+
     def __init__(self):
+        self._lib = None
+        self._device = None
         self._connected = False
+        self._read_fn: Optional[Callable[[], Optional[str]]] = None
 
     def connect(self) -> bool:
-        return False
+        lib = _import_lib()
+        if lib is None:
+            return False
+        self._lib = lib
 
-    def close(self) -> None:
-        pass
+        try:
+            reader_cls = getattr(lib, 'Reader', None)
+            if reader_cls is None:
+                nfc_mod = getattr(lib, 'nfc', None)
+                reader_cls = getattr(nfc_mod, 'Reader', None)
+            if reader_cls is None:
+                logger.debug('ACR122U library exposes no Reader class')
+                return False
+
+            self._device = reader_cls()
+            # Some libraries need an explicit connect, others connect lazily
+            try:
+                self._device.connect()
+            except Exception:
+                pass
+
+            # Resolve the read method once; get_uid() reuses the bound result
+            self._read_fn = self._resolve_read_fn(self._device)
+            self._connected = self._read_fn is not None
+            return self._connected
+        except Exception as e:
+            logger.debug('ACR122U connect failed: %s', e)
+            self._device = None
+            self._connected = False
+            return False
+
+    @staticmethod
+    def _resolve_read_fn(dev) -> Optional[Callable[[], Optional[str]]]:
+        """Probe the device once for a UID-read method and bind it.
+
+        Checks the known method names across the supported libraries in
+        preference order and returns a closure over the chosen bound method
+        plus its result decoder, so the per-poll call does no attribute or
+        type dispatch at all.
+        """
+        for attr in ('get_uid', 'read', 'read_tag', 'read_bytes', 'getid'):
+            fn = getattr(dev, attr, None)
+            if callable(fn):
+                return lambda read=fn: _decode_uid(read())
+
+        transmit = getattr(dev, 'transmit', None)
+        if callable(transmit):
+            def _via_transmit():
+                response, sw1, sw2 = transmit(_GET_UID_APDU)
+                if sw1 == 0x90:
+                    return _decode_uid(response)
+                return None
+            return _via_transmit
+
+        if hasattr(dev, 'uid'):
+            return lambda: _decode_uid(dev.uid)
 
-    def get_uid(self) -> Optional[str]:
         return None
 
+    def get_uid(self) -> Optional[str]:
+        if self._read_fn is None:
+            return None
+        try:
+            return self._read_fn()
+        except Exception:
+            # No card present / transient reader error - normal polling state
+            return None
+
     def set_beep(self, enable: bool) -> bool:
+        """Best-effort buzzer control; returns True only on confirmed success."""
+        if self._device is None:
+            return False
+        fn = getattr(self._device, 'set_beep', None)
+        if callable(fn):
+            try:
+                fn(enable)
+                return True
+            except Exception:
+                pass
         return False
 
+    def close(self) -> None:
+        if self._device is not None:
+            try:
+                self._device.close()
+            except Exception:
+                pass
+            finally:
+                self._device = None
+                self._connected = False
+                self._read_fn = None
+
 
 def open_reader() -> Optional[ACR122UWrapper]:
+    """Return a connected wrapper, or None if no library/reader is available."""
+    wrapper = ACR122UWrapper()
+    if wrapper.connect():
+        return wrapper
     return None
 
 
-def discover_acr_readers():
-    return False
+def discover_acr_readers() -> bool:
+    """Report whether an ACR122U backing library can be imported at all."""
+    return _import_lib() is not None
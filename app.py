@@ -1,29 +1,53 @@
 #!/usr/bin/env python3
 
 # --- Enhanced NFC card validation system with auto-update ---
+
+# eventlet's monkey patch must run before anything pulls in socket/ssl
+# (requests -> urllib3 does, and so do flask and concurrent.futures), or
+# those modules keep references to the unpatched blocking primitives and
+# every call through them pins the single-threaded hub. This is the very
+# first code in the entry point for that reason; server.py sees the
+# already-patched interpreter and skips its own patch.
+try:
+    import eventlet
+    eventlet.monkey_patch()
+except ImportError:
+    eventlet = None
+
 import threading
 import time
 import logging
 import os
 import json
-import shutil
 import sys
 import subprocess
 import argparse
+import atexit
+import re
+import select
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# orjson parses GitHub's release JSON several times faster than stdlib json
+# and is optional - everything falls back to the stdlib module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# psutil queries the OS connection table in-process (no subprocess fork,
+# no locale-dependent text parsing); netstat/lsof stay as the fallback
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # Setup logging FIRST, before any imports that use it
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Now import modules that may use logger
-try:
-    from py_acr122u import nfc
-except Exception:
-    nfc = None
-    # Do not error on import failure - nfc availability is optional
-    logger.debug('py_acr122u nfc module not available; nfc.Reader path disabled')
 import requests
 from flask import Response, request
 from server import app, socketio, run_server, stop_server  # server application instance and helpers
@@ -32,6 +56,19 @@ try:
 except Exception:
     acr122u_reader = None
 
+# pyscard's exception classes let the poll path classify "no card present"
+# with an O(1) type check instead of building str(e) and substring-scanning
+# it on every empty poll. The fallbacks are never raised, so the except
+# clauses below simply don't match when pyscard is missing.
+try:
+    from smartcard.Exceptions import NoCardException, CardConnectionException
+except Exception:
+    class NoCardException(Exception):
+        pass
+
+    class CardConnectionException(Exception):
+        pass
+
 # OS Detection
 IS_WINDOWS = os.name == 'nt'
 IS_LINUX = os.name == 'posix'
@@ -39,25 +76,78 @@ OS_NAME = 'Windows' if IS_WINDOWS else 'Linux/Unix' if IS_LINUX else 'Unknown'
 
 logger.info(f"Detected operating system: {OS_NAME}")
 
+# Vendor-specific buzzer-control APDUs tried by try_disable_reader_beep.
+# pyscard's transmit wants sequences of ints, so these are tuples: built
+# once at import instead of fresh list literals on every call.
+_BEEP_APDUS = (
+    # Common vendor-specific commands used by some readers (mute/unmute)
+    (0xFF, 0x00, 0x52, 0x00, 0x00),
+    (0xFF, 0x00, 0x52, 0x00, 0x01),
+    (0xFF, 0x00, 0x52, 0x00, 0x02),
+    (0xFF, 0x00, 0x52, 0x00, 0x03),
+    # Some devices use FF 00 40 .. sequences for LED/buzzer control
+    (0xFF, 0x00, 0x40, 0x00, 0x01),
+)
+# Extra candidates for ACR122U-family readers
+_ACR_BEEP_APDUS = (
+    (0xFF, 0x00, 0x51, 0x00, 0x01),
+    (0xFF, 0x00, 0x50, 0x00, 0x00),
+    (0xFF, 0x00, 0x50, 0x00, 0x01),
+)
+
 # Global variables
 reader = None
 nfc_reader_available = False
+_reader_connected = False  # True while the reader transport is known-open
+
+# Single lock for the reader globals above. The poll loop, the SocketIO
+# reinit handler and the PC/SC observers all touch them from different
+# threads; consistent ordering is what lets the connected-transport flag
+# skip redundant connect() calls safely.
+_NFC_LOCK = threading.Lock()
+
+# py_acr122u is imported lazily on first reader use - it pulls in pyusb and
+# friends, which we don't want to pay for (startup time + RSS) unless a
+# reader is actually used. sys.modules caches it so repeated calls are free.
+nfc = None
+_nfc_import_failed = False
+
+
+def _get_nfc_module():
+    """Import and cache py_acr122u's nfc module on first use.
+
+    Returns:
+        module or None: The nfc module, or None if py_acr122u is unavailable
+    """
+    global nfc, _nfc_import_failed
+
+    if nfc is None and not _nfc_import_failed:
+        try:
+            from py_acr122u import nfc as _nfc
+            nfc = _nfc
+        except Exception:
+            # Do not error on import failure - nfc availability is optional
+            _nfc_import_failed = True
+            logger.debug('py_acr122u nfc module not available; nfc.Reader path disabled')
+    return nfc
 
 def cleanup_nfc_reader():
     """
     Safely cleanup the NFC reader instance
     """
-    global reader, nfc_reader_available
-    
-    if reader is not None:
-        try:
-            reader.close()
-            logger.debug("NFC reader closed successfully")
-        except Exception as e:
-            logger.debug(f"Error closing NFC reader: {e}")
-        finally:
-            reader = None
-            nfc_reader_available = False
+    global reader, nfc_reader_available, _reader_connected
+
+    with _NFC_LOCK:
+        if reader is not None:
+            try:
+                reader.close()
+                logger.debug("NFC reader closed successfully")
+            except Exception as e:
+                logger.debug("Error closing NFC reader: %s", e)
+            finally:
+                reader = None
+                nfc_reader_available = False
+                _reader_connected = False
 
 # Database server configuration
 DATABASE_URL = "http://mensacheck.n-s-w.info"
@@ -65,14 +155,80 @@ VALIDATION_HEADERS = {
     'Content-Type': 'application/x-www-form-urlencoded'
 }
 
+# Shared HTTP session - HTTP keep-alive reuses the TCP connection across
+# card taps and update checks instead of paying a fresh handshake each time.
+_SESSION = requests.Session()
+try:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class _NoDelayAdapter(HTTPAdapter):
+        """HTTPAdapter with TCP_NODELAY and SO_KEEPALIVE on every socket.
+
+        The validation POST is a tiny request/response exchange - exactly
+        the pattern Nagle's algorithm delays while it waits to coalesce
+        segments. Flushing immediately shaves that delay off each swipe;
+        keepalive lets dead backend connections be noticed instead of
+        silently reused.
+        """
+        _SOCKET_OPTIONS = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs['socket_options'] = self._SOCKET_OPTIONS
+            return super().init_poolmanager(*args, **kwargs)
+
+    _adapter = _NoDelayAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    _SESSION.mount('http://', _adapter)
+    _SESSION.mount('https://', _adapter)
+except Exception:
+    # Pooling defaults still apply if the adapter setup fails
+    pass
+
 # Auto-update configuration
 GITHUB_REPO = "wandeltn/mensainfo-nfc"  # Your GitHub repository
 UPDATE_CHECK_INTERVAL = 86400  # Check for updates every day (86400 seconds)
 VERSION_FILE = "current_version.json"
 BACKUP_DIR = "backup"
+BACKUP_ENABLED = True  # --no-backup skips the pre-update backup entirely
+BACKUP_KEEP = 10  # prune all but the newest N backup directories
 RESTART_DELAY = 10  # Seconds to wait before restarting after app.py update
 BACKEND_HEALTH_POLL_INTERVAL = 30  # seconds between backend health checks
 
+# Absolute update-file paths, resolved once (the cwd is fixed for the
+# process lifetime). Tuple-of-tuples: (downloaded .new file, live target).
+_APP_PY = os.path.abspath('app.py')
+_APP_PY_NEW = os.path.abspath('app.py.new')
+_INDEX_HTML = os.path.abspath('index.html')
+_INDEX_HTML_NEW = os.path.abspath('index.html.new')
+_FILE_REPLACEMENTS = ((_APP_PY_NEW, _APP_PY), (_INDEX_HTML_NEW, _INDEX_HTML))
+
+
+def _prewarm_dns():
+    """Resolve the validation backend and GitHub API hosts once at startup
+    so the first card swipe / update check doesn't pay a DNS round-trip.
+    Also issues one HEAD to the backend so the session pool already holds
+    an open keep-alive connection when the first real swipe arrives."""
+    from urllib.parse import urlparse
+    for target in (DATABASE_URL, 'https://api.github.com'):
+        host = urlparse(target).hostname
+        try:
+            socket.getaddrinfo(host, 443 if target.startswith('https') else 80)
+            logger.debug('DNS prewarmed for %s', host)
+        except Exception as e:
+            logger.debug('DNS prewarm for %s failed: %s', host, e)
+    try:
+        _SESSION.head(DATABASE_URL, timeout=2)
+        logger.debug('Validation backend connection prewarmed')
+    except Exception as e:
+        logger.debug('Backend connection prewarm failed: %s', e)
+
 
 def backend_health_loop(poll_interval: int = BACKEND_HEALTH_POLL_INTERVAL):
     """Periodically check the validation backend and emit status changes to connected clients.
@@ -84,9 +240,9 @@ def backend_health_loop(poll_interval: int = BACKEND_HEALTH_POLL_INTERVAL):
         try:
             # Use HEAD to minimize payload; fallback to GET if HEAD not allowed
             try:
-                r = requests.head(DATABASE_URL, timeout=2)
+                r = _SESSION.head(DATABASE_URL, timeout=2)
             except Exception:
-                r = requests.get(DATABASE_URL, timeout=2)
+                r = _SESSION.get(DATABASE_URL, timeout=2)
             online = 200 <= r.status_code < 500
         except Exception:
             online = False
@@ -175,6 +331,18 @@ Examples:
         action='store_true',
         help='Disable the pyscard fast read mode; use the default reader library only (py122u/nfcpy)'
     )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='How long validated card results are served from the local cache without re-contacting the backend (0 disables caching)'
+    )
+    parser.add_argument(
+        '--no-backup',
+        action='store_true',
+        help='Skip creating file backups before applying an update (fastest path, mainly for debugging)'
+    )
     parser.add_argument(
         '--kill-port',
         action='store_true',
@@ -224,29 +392,18 @@ def try_disable_reader_beep():
                 conn = r[0].createConnection()
                 conn.connect()
                 # Best-effort: try some vendor control APDUs known to exist on some readers.
-                candidates = [
-                    # Common vendor-specific commands used by some readers (mute/unmute)
-                    [0xFF, 0x00, 0x52, 0x00, 0x00],
-                    [0xFF, 0x00, 0x52, 0x00, 0x01],
-                    [0xFF, 0x00, 0x52, 0x00, 0x02],
-                    [0xFF, 0x00, 0x52, 0x00, 0x03],
-                    # Some devices use FF 00 40 .. sequences for LED/buzzer control
-                    [0xFF, 0x00, 0x40, 0x00, 0x01],
-                ]
+                candidates = _BEEP_APDUS
 
                 # If we detect ACR122 in reader name, add specific candidates
                 reader_name = str(r[0])
                 if 'ACR' in reader_name.upper() or 'ACS' in reader_name.upper():
                     logger.info(f"Detected ACR reader: {reader_name} - trying ACR122U control APDUs")
-                    candidates += [
-                        [0xFF, 0x00, 0x51, 0x00, 0x01],
-                        [0xFF, 0x00, 0x50, 0x00, 0x00],
-                        [0xFF, 0x00, 0x50, 0x00, 0x01],
-                    ]
+                    candidates += _ACR_BEEP_APDUS
 
                 for apdu in candidates:
                     try:
-                        resp, sw1, sw2 = conn.transmit(apdu)
+                        # transmit wants a list of ints
+                        resp, sw1, sw2 = conn.transmit(list(apdu))
                         # sw1==0x90 indicates success for a lot of readers
                         if sw1 == 0x90:
                             logger.info(f"Reader beep control APDU sent successfully: {apdu}")
@@ -258,7 +415,7 @@ def try_disable_reader_beep():
                     except Exception:
                         continue
             except Exception as e:
-                logger.debug(f"pyscard control attempt failed: {e}")
+                logger.debug("pyscard control attempt failed: %s", e)
     except Exception:
         pass
 
@@ -325,11 +482,11 @@ def validate_card_with_database(uid):
         logger.info(f"Validating card UID: {uid}")
         
         # Send POST request to database server
-        response = requests.post(
-            DATABASE_URL, 
-            headers=VALIDATION_HEADERS, 
+        response = _SESSION.post(
+            DATABASE_URL,
+            headers=VALIDATION_HEADERS,
             data=payload,
-            timeout=3  # 3 second timeout for faster response
+            timeout=(1.0, 2.0)  # separate connect/read timeouts: fail fast on dead network, still allow a slow reply
         )
         
         # Check if request was successful (2xx status codes indicate success)
@@ -349,14 +506,25 @@ def validate_card_with_database(uid):
         logger.error(f"Unexpected error validating card {uid}: {e}")
         return False
 
+# Cache for index.html keyed on file mtime - repeat requests only pay for a
+# single stat() instead of open()+read()+decode. Auto-update rewrites the
+# file, which bumps the mtime and invalidates the cache automatically.
+_html_cache = {'mtime': None, 'body': None}
+
+
 def get_html_content():
     """
-    Load the HTML content from the index.html file.
+    Load the HTML content from the index.html file as raw bytes, cached on
+    its mtime so the hot path costs one stat instead of open/read/decode.
     Falls back to a basic template if file is not found.
     """
     try:
-        with open('index.html', 'r', encoding='utf-8') as f:
-            return f.read()
+        mtime = os.stat('index.html').st_mtime
+        if mtime != _html_cache['mtime']:
+            with open('index.html', 'rb') as f:
+                _html_cache['body'] = f.read()
+            _html_cache['mtime'] = mtime
+        return _html_cache['body']
     except FileNotFoundError:
         logger.warning("index.html not found, using fallback template")
         return """
@@ -373,61 +541,101 @@ def get_html_content():
 </html>
 """
 
+# Throttle state for reader availability events: when a reader is flaky or
+# unplugged, repeated availability checks would otherwise spam every
+# connected browser with the same event over and over.
+_AVAIL_EMIT_MIN_INTERVAL = 5.0  # seconds between identical availability emits
+_last_avail_emit = 0.0
+_last_avail_event = None  # last event name actually emitted
+
+# Fully static reader-unavailable payloads, built once; the emit path
+# hands them over verbatim so no dict is constructed per event.
+_MSG_READER_MISSING = 'NFC-Lesegerät nicht erkannt'
+_READER_PROBE_FAILED_PAYLOAD = {
+    'error': 'reader probe failed',
+    'message': _MSG_READER_MISSING,
+    'os': OS_NAME,
+}
+_READER_REMOVED_PAYLOAD = {
+    'error': 'reader removed',
+    'message': _MSG_READER_MISSING,
+    'os': OS_NAME,
+}
+
+
+def _emit_reader_availability(event, payload=None):
+    """Emit an nfc_reader_* availability event, rate-limited to once per
+    _AVAIL_EMIT_MIN_INTERVAL for sustained identical states. A state
+    change (a different event than last emitted) always goes through -
+    only repeats of the same state are suppressed."""
+    global _last_avail_emit, _last_avail_event
+    now = time.monotonic()
+    if event == _last_avail_event and now - _last_avail_emit < _AVAIL_EMIT_MIN_INTERVAL:
+        return
+    try:
+        if payload is None:
+            socketio.emit(event)
+        else:
+            socketio.emit(event, payload)
+        _last_avail_emit = now
+        _last_avail_event = event
+    except Exception:
+        pass  # Ignore WebSocket emission errors during startup
+
+
+def _probe_reader():
+    """Single locked reader probe shared by availability checks and polls.
+
+    Runs one connect/get_uid attempt and returns (reader_ok, uid).
+    reader_ok is True when a reader instance exists after the attempt -
+    a missing card does not count against the reader; uid is the card's
+    UID hex string if one was actually read.
+    """
+    with _NFC_LOCK:
+        uid = _connect_and_get_uid_locked()
+        return reader is not None, uid
+
+
 def test_nfc_reader_availability():
     """
     Test if the NFC reader is available and working.
-    Simply tries to create a reader instance.
-    
+
+    Shares one PC/SC probe with the card poll path, so a reinit costs a
+    single connect instead of a separate availability connect on top of
+    the loop's own.
+
     Returns:
         bool: True if reader is available, False otherwise
     """
-    global reader, nfc_reader_available
-    
-    try:
-        # Only create reader instance if it doesn't exist (lazy initialization)
-        if reader is None:
-            if nfc is None:
-                logger.debug(f"nfc.Reader unavailable on {OS_NAME}")
-                nfc_reader_available = False
-                return False
-            logger.debug(f"Creating NFC reader instance on {OS_NAME}...")
-            reader = nfc.Reader()
-        
-        nfc_reader_available = True
-        logger.debug(f"✅ NFC reader is available on {OS_NAME}")
-        
-        # Only emit events if we have active WebSocket connections
-        try:
-            socketio.emit('nfc_reader_available')
-        except:
-            pass  # Ignore WebSocket emission errors during startup
-        
-        return True
-        
-    except Exception as e:
-        nfc_reader_available = False
-        
-        # Clean up on error
-        if reader is not None:
-            try:
-                reader.close()
-            except:
-                pass
-            reader = None
-        
-        logger.debug(f"NFC reader not available: {e}")
-        
-        # Only emit events if we have active WebSocket connections
-        try:
-            socketio.emit('nfc_reader_unavailable', {
-                'error': str(e),
-                'message': 'NFC-Lesegerät nicht erkannt',
-                'os': OS_NAME
-            })
-        except:
-            pass  # Ignore WebSocket emission errors during startup
-            
-        return False
+    global nfc_reader_available
+
+    ok, _uid = _probe_reader()
+    with _NFC_LOCK:
+        nfc_reader_available = ok
+
+    if ok:
+        logger.debug("✅ NFC reader is available on %s", OS_NAME)
+        # Rate-limited so flaky readers don't flood connected clients
+        _emit_reader_availability('nfc_reader_available')
+    else:
+        logger.debug("NFC reader not available on %s", OS_NAME)
+        # Rate-limited so a sustained failure doesn't spam every client
+        _emit_reader_availability('nfc_reader_unavailable', _READER_PROBE_FAILED_PAYLOAD)
+
+    return ok
+
+def _uid_to_hex(uid_bytes):
+    """Format a UID byte sequence as an uppercase hex string.
+
+    bytes.hex() runs the whole conversion in one C call instead of one
+    f-string format per byte; strings pass through (uppercased) unchanged.
+    """
+    if isinstance(uid_bytes, str):
+        return uid_bytes.upper()
+    if isinstance(uid_bytes, (bytes, bytearray)):
+        return uid_bytes.hex().upper()
+    return bytes(uid_bytes).hex().upper()
+
 
 def try_connect_and_get_uid():
     """
@@ -438,26 +646,38 @@ def try_connect_and_get_uid():
     Returns:
         str or None: Card UID in uppercase hex format, or None if no card/error
     """
-    global nfc_reader_available, reader
-    
+    with _NFC_LOCK:
+        return _connect_and_get_uid_locked()
+
+
+def _connect_and_get_uid_locked():
+    """Body of try_connect_and_get_uid; caller must hold _NFC_LOCK."""
+    global nfc_reader_available, reader, _reader_connected
+
     try:
         # Create reader if it doesn't exist (lazy initialization)
         if reader is None:
-            if nfc is None:
+            nfc_mod = _get_nfc_module()
+            if nfc_mod is None:
                 logger.debug('nfc.Reader unavailable (py_acr122u not installed)')
                 return None
             logger.debug('Creating nfc.Reader instance')
-            reader = nfc.Reader()
-        
-        # Non-blocking connect() and get_uid() - they return immediately
-        # If no card is present, they raise exceptions which we catch as "no card"
+            reader = nfc_mod.Reader()
+
+        # Non-blocking connect() and get_uid() - they return immediately.
+        # If no card is present, they raise exceptions which we catch as
+        # "no card". connect() is only issued when the transport isn't
+        # already open; keeping it open avoids a PCSC round-trip per poll,
+        # and any read error below drops the flag so the next poll reconnects.
         try:
-            reader.connect()
+            if not _reader_connected:
+                reader.connect()
+                _reader_connected = True
             uid_response = reader.get_uid()
             
             # get_uid() returns a list of integers (the UID bytes)
             if uid_response:
-                uid_hex = ''.join([f'{x:02X}' for x in uid_response])
+                uid_hex = _uid_to_hex(uid_response)
                 logger.info(f'Card detected! UID: {uid_hex}')
                 nfc_reader_available = True
                 return uid_hex
@@ -465,21 +685,25 @@ def try_connect_and_get_uid():
                 logger.debug('get_uid() returned empty response')
                 nfc_reader_available = False
                 return None
+        except (NoCardException, CardConnectionException) as e:
+            # Normal polling state - no card on the reader
+            logger.debug('No card detected: %s', e)
+            nfc_reader_available = False
+            _reader_connected = False
+            return None
         except Exception as e:
-            # connect() or get_uid() raise exceptions when there's no card
-            # We treat these as "no card available" - a normal polling state, not an error
-            msg = str(e)
-            if any(x in msg.lower() for x in ['card not connected', 'connect', 'no card', 'instruction', 'communication']):
-                logger.debug(f'No card detected: {e}')
-            else:
-                logger.debug(f'Reader call raised exception: {e}')
+            # connect() or get_uid() raise other exceptions for transient
+            # reader trouble; also treated as "no card available"
+            logger.debug('Reader call raised exception: %s', e)
             nfc_reader_available = False
+            _reader_connected = False
             return None
-    
+
     except Exception as e:
         # Unexpected error outside of connect/get_uid - reset reader for next attempt
-        logger.debug(f'Unexpected error in try_connect_and_get_uid: {e}')
+        logger.debug('Unexpected error in try_connect_and_get_uid: %s', e)
         nfc_reader_available = False
+        _reader_connected = False
         if reader is not None:
             try:
                 reader.close()
@@ -488,130 +712,320 @@ def try_connect_and_get_uid():
             reader = None
         return None
 
+# Directory this module lives in
+_APP_DIR = os.path.dirname(os.path.abspath(__file__)) or '.'
+
+
+def _html_response():
+    """Serve index.html from the in-memory byte cache.
+
+    The hot path is one stat() (mtime check in get_html_content) plus a
+    Response wrapped around the cached bytes - no open/read/decode per
+    request. The mtime doubles as the ETag so browsers get 304s and the
+    tag rolls over automatically when an update replaces the file.
+    """
+    body = get_html_content()
+    response = Response(body, mimetype='text/html')
+    if _html_cache['mtime'] is not None:
+        # no-cache = revalidate every time, so clients always see a freshly
+        # applied update but still get cheap 304s in between
+        response.headers['Cache-Control'] = 'no-cache'
+        response.set_etag(str(_html_cache['mtime']))
+        return response.make_conditional(request)
+    return response
+
+
 # Flask routes
 @app.route('/')
 def index():
     """Serve the main HTML page."""
-    return Response(get_html_content(), mimetype='text/html')
+    return _html_response()
 
 @app.route('/fetch_html')
 def fetch_html():
     """Legacy route for HTML content."""
-    return Response(get_html_content(), mimetype='text/html')
+    return _html_response()
 
 last_uid = None
 last_validation_result = None
-reading_in_progress = False  # When True we are validating/processing a card
-
-# pending_validations maps UID to a threading.Event used to cancel a background
-# validation if the card is removed before validation completes.
-pending_validations = {}
+# Guards _inflight_validations (defined next to the validation cache below)
 pending_validations_lock = threading.Lock()
 
+POLL_INTERVAL = 0.03  # default polling interval
+IDLE_POLL_MAX = 3.0  # ceiling for the idle poll backoff (fallback loop only)
+NO_READER_POLL_MAX = 30.0  # higher ceiling while no reader is attached at all
+
+# APDU to read the card UID via PC/SC (same command libnfc.py uses)
+GET_UID_APDU = [0xFF, 0xCA, 0x00, 0x00, 0x00]
+
+# Validation runs on this pool so the detection thread never blocks on the
+# HTTP round-trip; a network stall no longer delays card removal events.
+# max_workers=2 also caps concurrency, so a swipe burst cannot pile
+# threads onto the backend.
+_VALIDATE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='validate')
+atexit.register(_VALIDATE_POOL.shutdown, wait=False)
+_inflight_validations = set()  # UIDs with a validation currently submitted
+
+# Shared pool for short-lived background jobs kicked off by SocketIO
+# handlers (e.g. reader reinit), instead of a fresh thread per click
+_BG_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='bg')
+atexit.register(_BG_POOL.shutdown, wait=False)
+
+# Short-lived validation result cache: a card re-presented within the TTL
+# skips the network round-trip and gets its result emitted instantly.
+# Only definite True/False results are cached, never connectivity errors.
+VALIDATION_CACHE_TTL = 60.0  # seconds; 0 disables caching (--cache-ttl)
+_UID_CACHE_MAX = 512
+_uid_cache = {}  # uid -> (is_valid, expiry per time.monotonic())
+_uid_cache_lock = threading.Lock()
+
+
+def _cached_validation(uid):
+    """Return the cached validation result for uid, or None on miss/expiry."""
+    if VALIDATION_CACHE_TTL <= 0:
+        return None
+    with _uid_cache_lock:
+        entry = _uid_cache.get(uid)
+        if entry is None:
+            return None
+        is_valid, expiry = entry
+        if time.monotonic() >= expiry:
+            del _uid_cache[uid]
+            return None
+        return is_valid
+
+
+def _store_validation(uid, is_valid):
+    """Cache a definite validation outcome for VALIDATION_CACHE_TTL seconds."""
+    if VALIDATION_CACHE_TTL <= 0 or is_valid is None:
+        return
+    with _uid_cache_lock:
+        if len(_uid_cache) >= _UID_CACHE_MAX:
+            # Cache is tiny and entries are short-lived; wholesale reset
+            # is simpler than LRU bookkeeping
+            _uid_cache.clear()
+        _uid_cache[uid] = (is_valid, time.monotonic() + VALIDATION_CACHE_TTL)
+
+
+def _emit_validation_result(uid, future):
+    """Done-callback for _VALIDATE_POOL: emit the outcome for a card."""
+    with pending_validations_lock:
+        _inflight_validations.discard(uid)
 
-def validate_card_async(uid: str, cancel_event: threading.Event):
-    """
-    Run card validation in a background thread to avoid blocking the main polling loop.
-    If cancel_event is set during the procedure, the function will abort without emitting result events.
-    """
     try:
-        logger.info(f"Background validation started for {uid}")
-        # Inform clients the validation is now in progress (distinct from 'processing')
-        try:
-            socketio.emit('card_validating', {
-                'uid': uid,
-                'message': 'Karte wird validiert',
-                'timestamp': time.time()
-            })
-        except Exception:
-            pass
+        is_valid = future.result()
+    except Exception as e:
+        logger.error(f"Background validation for {uid} failed: {e}")
+        return
 
-        # Show progress update
-        try:
-            socketio.emit('card_progress', {'uid': uid, 'progress': 70})
-        except Exception:
-            pass
+    if is_valid is None:
+        # Backend connectivity issue, not an unauthorized card: tell the
+        # clients validation is offline instead of rejecting the card
+        logger.error(f"Validation backend not reachable for {uid}")
+        timestamp_ms = time.time_ns() // 1_000_000
+        socketio.emit('card_validation_offline', {
+            'uid': uid,
+            'message': 'Validierungsdienst nicht erreichbar',
+            'timestamp': timestamp_ms
+        })
+        socketio.emit('validation_backend_status', {
+            'online': False,
+            'message': 'Backend nicht erreichbar',
+            'timestamp': timestamp_ms
+        })
+        return
+
+    _store_validation(uid, is_valid)
+    _emit_card_result(uid, is_valid)
 
-        # Run validation (blocking network call) - validate_card_with_database has its own timeout
-        is_valid = validate_card_with_database(uid)
 
-        # If the cancel event was set during the call, abort and do not emit a final outcome
-        if cancel_event.is_set():
-            logger.info(f"Validation cancelled for {uid}")
+# Constant payload strings for the card-result events; the timestamp is an
+# integer millisecond count (time_ns // 1e6), which serializes without the
+# float repr work of time.time() and is what Date() expects client-side.
+_MSG_CARD_VALID = 'Karte berechtigt'
+_MSG_CARD_INVALID = 'Karte nicht berechtigt'
+
+
+def _emit_card_result(uid, is_valid):
+    """Emit the success/unauthorized event for a validated card."""
+    global last_validation_result
+
+    last_validation_result = is_valid
+    timestamp_ms = time.time_ns() // 1_000_000
+    if is_valid:
+        logger.info(f"Card {uid} is VALID")
+        socketio.emit('card_success', {
+            'uid': uid,
+            'message': _MSG_CARD_VALID,
+            'timestamp': timestamp_ms
+        })
+    else:
+        logger.warning(f"Card {uid} is INVALID")
+        socketio.emit('card_unauthorized', {
+            'uid': uid,
+            'message': _MSG_CARD_INVALID,
+            'timestamp': timestamp_ms
+        })
+
+
+def _read_uid_from_card(card):
+    """Read the UID from a pyscard Card object delivered by CardMonitor.
+
+    Returns the UID as an uppercase hex string, or None if the card could not
+    be read (e.g. it was removed again before we could connect).
+    """
+    try:
+        conn = card.createConnection()
+        conn.connect()
+        try:
+            response, sw1, sw2 = conn.transmit(GET_UID_APDU)
+            if sw1 == 0x90 and response:
+                return _uid_to_hex(response)
+            logger.debug('GET UID APDU failed: SW=%02X%02X', sw1, sw2)
+            return None
+        finally:
             try:
-                socketio.emit('card_processing_cancelled', {
-                    'uid': uid,
-                    'message': 'Validierung abgebrochen (Karte entfernt)'
-                })
+                conn.disconnect()
             except Exception:
                 pass
+    except Exception as e:
+        logger.debug('Could not read UID from inserted card: %s', e)
+        return None
+
+
+def _handle_card_inserted(uid):
+    """Shared handling for a newly detected card (event-driven or polled).
+
+    The HTTP validation is dispatched to _VALIDATE_POOL and its result is
+    emitted from a done-callback, so the caller returns to card detection
+    immediately. A UID whose validation is still in flight is not submitted
+    a second time.
+    """
+    global last_uid
+    last_uid = uid
+    logger.info(f"New card detected: {uid}")
+
+    # Recently validated card? Answer from the local cache without touching
+    # the network at all.
+    cached = _cached_validation(uid)
+    if cached is not None:
+        logger.info(f"Validation cache hit for {uid}")
+        _emit_card_result(uid, cached)
+        return
+
+    with pending_validations_lock:
+        if uid in _inflight_validations:
+            logger.debug("Validation for %s already in flight, skipping", uid)
             return
+        _inflight_validations.add(uid)
 
-        # Final progress
-        try:
-            socketio.emit('card_progress', {'uid': uid, 'progress': 100})
-        except Exception:
-            pass
+    future = _VALIDATE_POOL.submit(validate_card_with_database, uid)
+    future.add_done_callback(lambda f, uid=uid: _emit_validation_result(uid, f))
 
-        # Emit final result or indicate error/offline
-        if is_valid is None:
-            # treat as backend connectivity issue - inform clients of offline validation
-            logger.error(f"Validation backend not reachable for {uid}")
-            try:
-                socketio.emit('card_validation_offline', {'uid': uid, 'message': 'Validierungsdienst nicht erreichbar', 'timestamp': time.time()})
-                # Notify clients that backend health is offline
-                socketio.emit('validation_backend_status', {'online': False, 'message': 'Backend nicht erreichbar', 'timestamp': time.time()})
-            except Exception:
-                pass
-        elif is_valid:
-            logger.info(f"Card {uid} validated (async)")
-            try:
-                socketio.emit('card_validation_online', {'uid': uid, 'message': 'Validierung erfolgreich', 'timestamp': time.time()})
-            except Exception:
-                pass
-            try:
-                # Notify clients the backend is reachable again
-                socketio.emit('validation_backend_status', {'online': True, 'message': 'Backend erreichbar', 'timestamp': time.time()})
-                socketio.emit('card_success', {'uid': uid, 'message': 'Karte berechtigt'})
-            except Exception:
-                pass
-        else:
-            logger.warning(f"Card {uid} invalid (async)")
-            try:
-                socketio.emit('card_validation_online', {'uid': uid, 'message': 'Validierung abgeschlossen (nicht autorisiert)', 'timestamp': time.time()})
-            except Exception:
-                pass
-            try:
-                # Backend is reachable, publish health status online
-                socketio.emit('validation_backend_status', {'online': True, 'message': 'Backend erreichbar', 'timestamp': time.time()})
-                socketio.emit('card_unauthorized', {'uid': uid, 'message': 'Karte nicht berechtigt'})
-            except Exception:
-                pass
 
+# Debounce for the idempotent 'reload' broadcast: a card bouncing on the
+# reader can fire several removal events within milliseconds, and each
+# emit wakes every connected client for no new information.
+_RELOAD_DEBOUNCE = 0.2
+_reload_lock = threading.Lock()
+_last_reload_ts = 0.0
+
+
+def _emit_reload_debounced():
+    """Broadcast 'reload' at most once per debounce window."""
+    global _last_reload_ts
+    now = time.monotonic()
+    with _reload_lock:
+        if now - _last_reload_ts < _RELOAD_DEBOUNCE:
+            return
+        _last_reload_ts = now
+    socketio.emit('reload')
+
+
+def _handle_card_removed():
+    """Shared handling for card removal (event-driven or polled)."""
+    global last_uid, last_validation_result
+    if last_uid is not None:
+        logger.info(f"Card {last_uid} removed")
+        last_uid = None
+        last_validation_result = None
+        _emit_reload_debounced()
+
+
+def start_card_monitoring():
+    """Start card detection, preferring pyscard's event-driven monitors.
+
+    With pyscard installed we register a CardObserver, so the monitoring
+    thread blocks inside PC/SC's native SCardGetStatusChange wait and wakes
+    only on actual insert/remove events (no idle polling at all). A
+    ReaderObserver replaces periodic reader-presence polling the same way.
+    Without pyscard we fall back to the classic card_check_loop poll thread.
+
+    Returns the objects that must stay referenced to keep monitoring alive.
+    """
+    if socketio.async_mode == 'eventlet':
+        # pyscard's monitor threads live inside the native blocking
+        # SCardGetStatusChange wait. Under eventlet's monkey patch those
+        # "threads" are greenlets on the hub's single OS thread, and a
+        # greenlet cannot yield out of a blocking C call - the wait would
+        # pin the hub and stall every HTTP/WebSocket client. Poll instead:
+        # each probe is a short native call between cooperative
+        # socketio.sleep() yields.
+        logger.info('eventlet async mode: using polled card detection '
+                    '(PC/SC monitor threads would block the event hub)')
+        return socketio.start_background_task(card_check_loop)
+
+    try:
+        from smartcard.CardMonitoring import CardMonitor, CardObserver
+        from smartcard.ReaderMonitoring import ReaderMonitor, ReaderObserver
     except Exception as e:
-        logger.error(f"Error in background validation for {uid}: {e}")
-        try:
-            # In this unexpected error case, notify clients of validation error
-            socketio.emit('card_validation_error', {'uid': uid, 'message': str(e)})
-        except Exception:
-            pass
-    finally:
-        # Clean up pending validation entry and leave a small grace before allowing new reads
-        with pending_validations_lock:
+        logger.info(f'pyscard monitoring unavailable ({e}), using polling loop')
+        # start_background_task keeps the loop's emits on the server's own
+        # async layer (greenlet under eventlet), so broadcasts stay safe
+        return socketio.start_background_task(card_check_loop)
+
+    class _CardEvents(CardObserver):
+        def update(self, observable, actions):
+            added, removed = actions
             try:
-                pending_validations.pop(uid, None)
-            except Exception:
-                pass
-        # Ensure the reading flag is cleared so new cards can be processed
-        global reading_in_progress, last_uid
-        reading_in_progress = False
-        last_uid = None
+                for card in added:
+                    uid = _read_uid_from_card(card)
+                    if uid and uid != last_uid:
+                        _handle_card_inserted(uid)
+                if removed:
+                    _handle_card_removed()
+            except Exception as e:
+                logger.error(f'Error handling card event: {e}')
+
+    class _ReaderEvents(ReaderObserver):
+        def update(self, observable, actions):
+            added, removed = actions
+            global nfc_reader_available
+            try:
+                if added:
+                    with _NFC_LOCK:
+                        nfc_reader_available = True
+                    logger.info(f'NFC reader connected: {added}')
+                    socketio.emit('nfc_reader_available')
+                if removed and not added:
+                    with _NFC_LOCK:
+                        nfc_reader_available = False
+                    logger.warning(f'NFC reader disconnected: {removed}')
+                    socketio.emit('nfc_reader_unavailable', _READER_REMOVED_PAYLOAD)
+            except Exception as e:
+                logger.debug('Error handling reader event: %s', e)
+
+    card_monitor = CardMonitor()
+    card_observer = _CardEvents()
+    card_monitor.addObserver(card_observer)
+
+    reader_monitor = ReaderMonitor()
+    reader_observer = _ReaderEvents()
+    reader_monitor.addObserver(reader_observer)
+
+    logger.info('Event-driven PC/SC card monitoring started (SCardGetStatusChange)')
+    return (card_monitor, card_observer, reader_monitor, reader_observer)
 
-# Read stability behaviour
-CARD_STABILITY_CHECKS = 2  # number of consecutive equal UID samples for stability (1 = faster)
-CARD_STABILITY_INTERVAL = 0.02  # seconds between stability samples (20ms)
-CARD_PROCESSING_GRACE_PERIOD = 0.6  # seconds grace to wait for transient removals
-POLL_INTERVAL = 0.03  # default polling interval
 
 def card_check_loop():
     """
@@ -625,99 +1039,194 @@ def card_check_loop():
     # Don't aggressively test NFC reader on startup - let it initialize naturally
     # This matches the old version's behavior where reader was only tested when needed
     logger.info("NFC reader will be initialized on first card detection attempt")
-    
+
+    idle_streak = 0  # consecutive empty polls; drives the adaptive backoff
+
     while True:
         try:
             # Simple approach like the old version - just try to read cards
             uid = try_connect_and_get_uid()
-            
+
             if uid:
-                # New card detected
+                # New card detected - snap back to the fast poll cadence
+                idle_streak = 0
                 if uid != last_uid:
-                    last_uid = uid
-                    logger.info(f"New card detected: {uid}")
-                    
-                    # Validate card with database
-                    is_valid = validate_card_with_database(uid)
-                    last_validation_result = is_valid
-                    
-                    if is_valid:
-                        logger.info(f"Card {uid} is VALID")
-                        socketio.emit('card_success', {
-                            'uid': uid,
-                            'message': 'Karte berechtigt',
-                            'timestamp': time.time()
-                        })
-                    else:
-                        logger.warning(f"Card {uid} is INVALID")
-                        socketio.emit('card_unauthorized', {
-                            'uid': uid,
-                            'message': 'Karte nicht berechtigt',
-                            'timestamp': time.time()
-                        })
+                    _handle_card_inserted(uid)
             else:
                 # Card removed or no card present
-                if last_uid is not None:
-                    logger.info(f"Card {last_uid} removed")
-                    last_uid = None
-                    last_validation_result = None
-                    socketio.emit('reload')
-                    
+                idle_streak += 1
+                _handle_card_removed()
+
         except Exception as e:
             # Simple error handling like old version
+            idle_streak += 1
             if last_uid is not None:
                 logger.info("Card removed (exception)")
-                last_uid = None
-                last_validation_result = None
-                socketio.emit('reload')
+                _handle_card_removed()
+
+        # Adaptive cadence: poll fast while a card is (or was just) present,
+        # back off multiplicatively after a long idle stretch so hours of no
+        # traffic don't burn CPU on empty reads. With no reader attached at
+        # all (reader instance could not even be created) the ceiling rises
+        # further - there is nothing to detect until hardware shows up, and
+        # any successful read snaps straight back to the fast cadence.
+        if idle_streak == 0:
+            delay = POLL_INTERVAL
+        else:
+            ceiling = IDLE_POLL_MAX if reader is not None else NO_READER_POLL_MAX
+            delay = min(ceiling, POLL_INTERVAL * (1.2 ** min(idle_streak, 48)))
+        time.sleep(delay)
+
 
-        time.sleep(POLL_INTERVAL)  # Check every 300ms for faster response
+# In-memory copy of the parsed version file. It only changes through
+# save_current_version, yet it is queried on every client connect, so
+# cache the parse instead of re-reading the file each time.
+_version_cache = None
 
 
 def get_current_version():
-    """Get the current version from version file"""
+    """Get the current version from version file.
+
+    Returns a copy: callers mutate the result (e.g. the version-info
+    handler adds UI-only fields), and handing out the cached dict by
+    reference would let those fields leak into the next save.
+    """
+    global _version_cache
+    if _version_cache is not None:
+        return dict(_version_cache)
     try:
-        with open(VERSION_FILE, 'r') as f:
-            version_data = json.load(f)
-            return version_data
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(VERSION_FILE, 'rb') as f:
+            raw = f.read()
+        _version_cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (FileNotFoundError, ValueError):
         # Default version info if file doesn't exist
         logger.warning(f"Version file not found or invalid, using default version")
-        return {
+        _version_cache = {
             'tag_name': 'v0.0.0',
             'updated_at': datetime.now().isoformat(),
             'commit_sha': 'unknown'
         }
+    return dict(_version_cache)
 
 def save_current_version(version_data):
     """Save version information to file"""
+    global _version_cache
     try:
-        with open(VERSION_FILE, 'w') as f:
-            json.dump(version_data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(version_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(version_data, indent=2).encode()
+        with open(VERSION_FILE, 'wb') as f:
+            f.write(payload)
+        _version_cache = dict(version_data)
         logger.info(f"Saved version info: {version_data['tag_name']}")
     except Exception as e:
         logger.error(f"Failed to save version info: {e}")
 
+# On-disk cache of the last release lookup: {fetched_at, etag, body}.
+# Lets repeated checks inside the update interval (startup, manual
+# re-checks) answer from a local file instead of a WAN round-trip.
+RELEASE_CACHE_FILE = ".github_release_cache.json"
+
+
+def _load_release_cache():
+    """Return the cached release lookup dict, or None if absent/corrupt."""
+    try:
+        with open(RELEASE_CACHE_FILE, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _save_release_cache(cache):
+    """Atomically rewrite the release cache file (best-effort)."""
+    try:
+        if orjson is not None:
+            payload = orjson.dumps(cache)
+        else:
+            payload = json.dumps(cache).encode()
+        tmp_path = RELEASE_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, RELEASE_CACHE_FILE)
+    except Exception as e:
+        logger.debug("Could not write release cache: %s", e)
+
+
 def check_for_updates():
-    """Check GitHub for new releases"""
+    """Check GitHub for new releases.
+
+    A fresh on-disk cache (younger than UPDATE_CHECK_INTERVAL) answers
+    without any network traffic. Past the TTL, the stored ETag goes out
+    as If-None-Match so an unchanged release costs a bare 304 (no JSON
+    body, not counted against the API rate limit).
+    """
     try:
         url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-        response = requests.get(url, timeout=10)
-        
+        current_version = get_current_version()
+
+        cache = _load_release_cache() or {}
+        cached_body = cache.get('body')
+        cache_age = time.time() - cache.get('fetched_at', 0)
+        if cached_body and 0 <= cache_age < UPDATE_CHECK_INTERVAL:
+            if cached_body['tag_name'] != current_version['tag_name']:
+                logger.info(f"New version available (cached): {cached_body['tag_name']} (current: {current_version['tag_name']})")
+                return cached_body
+            logger.info(f"Release cache is fresh ({int(cache_age)}s old); current version {current_version['tag_name']} is up to date")
+            return None
+
+        etag = cache.get('etag') or current_version.get('release_etag')
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': f'mensainfo-nfc-updater ({GITHUB_REPO})',
+        }
+        if etag:
+            headers['If-None-Match'] = etag
+        response = _SESSION.get(url, headers=headers, timeout=10)
+
+        if response.status_code == 304:
+            if cached_body:
+                cache['fetched_at'] = time.time()
+                _save_release_cache(cache)
+                # A 304 means the release is unchanged, not that it was
+                # applied: if a previous apply failed, the cached body is
+                # still newer than what's on disk and must be retried
+                if cached_body['tag_name'] != current_version['tag_name']:
+                    logger.info(f"New version still pending (304): {cached_body['tag_name']} (current: {current_version['tag_name']})")
+                    return cached_body
+            logger.info(f"Release unchanged since last check (304); current version {current_version['tag_name']} is up to date")
+            return None
+
         if response.status_code == 200:
-            latest_release = response.json()
-            current_version = get_current_version()
-            
+            if orjson is not None:
+                latest_release = orjson.loads(response.content)
+            else:
+                latest_release = response.json()
+
+            _save_release_cache({
+                'fetched_at': time.time(),
+                'etag': response.headers.get('ETag'),
+                'body': latest_release,
+            })
+
             if latest_release['tag_name'] != current_version['tag_name']:
                 logger.info(f"New version available: {latest_release['tag_name']} (current: {current_version['tag_name']})")
                 return latest_release
             else:
+                # Persist the ETag only in the up-to-date case: while an
+                # update is pending we want the next check to re-fetch, not
+                # short-circuit on a 304.
+                new_etag = response.headers.get('ETag')
+                if new_etag and new_etag != etag:
+                    current_version['release_etag'] = new_etag
+                    save_current_version(current_version)
                 logger.info(f"Current version {current_version['tag_name']} is up to date")
                 return None
         else:
             logger.warning(f"Failed to check for updates: HTTP {response.status_code}")
             return None
-            
+
     except Exception as e:
         logger.error(f"Error checking for updates: {e}")
         return None
@@ -725,6 +1234,8 @@ def check_for_updates():
 def backup_current_files():
     """Create backup of current files before update"""
     try:
+        import shutil  # only needed on the once-a-day update path
+
         # Ensure backup directory exists (cross-platform)
         backup_dir_path = os.path.abspath(BACKUP_DIR)
         if not os.path.exists(backup_dir_path):
@@ -742,117 +1253,146 @@ def backup_current_files():
             source_path = os.path.abspath(filename)
             if os.path.exists(source_path):
                 dest_path = os.path.join(backup_subdir, filename)
-                shutil.copy2(source_path, dest_path)
+                # Hardlink where possible: one inode ref, zero bytes copied.
+                # apply_update replaces the original via os.replace (new
+                # inode), so the link keeps pointing at the old contents.
+                try:
+                    os.link(source_path, dest_path)
+                except OSError:
+                    # Cross-device, no-hardlink filesystem, or Windows perms.
+                    # copyfile instead of copy2: the backup doesn't need the
+                    # original's mtime/permissions re-applied.
+                    shutil.copyfile(source_path, dest_path)
                 backed_up_files.append(filename)
                 logger.info(f"Backed up {filename} to {dest_path}")
         
         logger.info(f"Created backup in {backup_subdir} ({OS_NAME}) - Files: {', '.join(backed_up_files)}")
+        _prune_old_backups(backup_dir_path)
         return backup_subdir
-        
+
     except Exception as e:
         logger.error(f"Failed to create backup on {OS_NAME}: {e}")
         return None
 
+
+def _prune_old_backups(backup_dir_path, keep=BACKUP_KEEP):
+    """Remove all but the newest `keep` backup directories (best-effort).
+
+    The timestamped names sort chronologically, so no stat calls are
+    needed to order them.
+    """
+    try:
+        import shutil
+
+        with os.scandir(backup_dir_path) as entries:
+            backups = sorted(
+                e.name for e in entries
+                if e.is_dir() and e.name.startswith('backup_')
+            )
+        for name in backups[:-keep] if keep else backups:
+            shutil.rmtree(os.path.join(backup_dir_path, name), ignore_errors=True)
+            logger.info(f"Pruned old backup {name}")
+    except Exception as e:
+        logger.debug("Backup pruning failed: %s", e)
+
 def download_release_files(release_info):
-    """Download app.py and index.html from the latest release"""
+    """Download app.py and index.html from the latest release.
+
+    The tarball is streamed straight out of the HTTP response into
+    tarfile's pipe mode ('r|gz'): extraction begins while the download is
+    still running, peak memory stays at the read-buffer size, and no temp
+    copy of the archive ever touches disk. Wanted members are matched by
+    basename through a single dict lookup, and the scan stops as soon as
+    both files are captured.
+    """
     try:
         # Get the download URLs for the release files
         tarball_url = release_info.get('tarball_url')
-        
+
         if not tarball_url:
             logger.error("No tarball URL found in release")
             return False
-        
-        # Download the release tarball
+
+        # Update-path-only imports
+        import tarfile
+        import shutil
+
+        remaining = {'app.py': _APP_PY_NEW, 'index.html': _INDEX_HTML_NEW}
+        captured = 0
+
         logger.info(f"Downloading release {release_info['tag_name']}...")
-        response = requests.get(tarball_url, timeout=30)
-        
-        if response.status_code == 200:
-            # Save tarball temporarily
-            import tempfile
-            import tarfile
-            
-            with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False) as tmp_file:
-                tmp_file.write(response.content)
-                tmp_path = tmp_file.name
-            
-            # Extract the files we need
-            with tarfile.open(tmp_path, 'r:gz') as tar:
-                members = tar.getmembers()
-                
-                # Find app.py and index.html in the tarball
-                app_py_member = None
-                index_html_member = None
-                
-                for member in members:
-                    if member.name.endswith('app.py'):
-                        app_py_member = member
-                    elif member.name.endswith('index.html'):
-                        index_html_member = member
-                
-                # Extract and save the files (cross-platform)
-                temp_extract_dir = tempfile.mkdtemp()
-                
-                if app_py_member:
-                    tar.extract(app_py_member, path=temp_extract_dir)
-                    extracted_app_py = os.path.join(temp_extract_dir, app_py_member.name)
-                    dest_app_py = os.path.abspath('app.py.new')
-                    shutil.move(extracted_app_py, dest_app_py)
-                    logger.info(f"Downloaded new app.py to {dest_app_py} ({OS_NAME})")
-                
-                if index_html_member:
-                    tar.extract(index_html_member, path=temp_extract_dir)
-                    extracted_index_html = os.path.join(temp_extract_dir, index_html_member.name)
-                    dest_index_html = os.path.abspath('index.html.new')
-                    shutil.move(extracted_index_html, dest_index_html)
-                    logger.info(f"Downloaded new index.html to {dest_index_html} ({OS_NAME})")
-                
-                # Clean up temp extraction directory
-                try:
-                    shutil.rmtree(temp_extract_dir)
-                except:
-                    pass
-            
-            # Clean up temp file
-            os.unlink(tmp_path)
-            
-            return app_py_member is not None or index_html_member is not None
-        else:
-            logger.error(f"Failed to download release: HTTP {response.status_code}")
-            return False
-            
+        with _SESSION.get(tarball_url, stream=True, timeout=30) as response:
+            if response.status_code != 200:
+                logger.error(f"Failed to download release: HTTP {response.status_code}")
+                return False
+
+            # Undo any transport-level compression so tarfile sees the
+            # actual gzip tar stream
+            response.raw.decode_content = True
+
+            with tarfile.open(fileobj=response.raw, mode='r|gz') as tar:
+                for member in tar:
+                    new_name = remaining.pop(os.path.basename(member.name), None)
+                    if new_name is None:
+                        continue
+                    extracted = tar.extractfile(member)
+                    if extracted is None:
+                        continue
+                    dest_path = new_name  # already absolute
+                    with open(dest_path, 'wb') as out:
+                        shutil.copyfileobj(extracted, out, length=65536)
+                    captured += 1
+                    logger.info(f"Downloaded new {new_name} to {dest_path} ({OS_NAME})")
+                    if not remaining:
+                        break
+
+        return captured > 0
+
     except Exception as e:
         logger.error(f"Error downloading release files: {e}")
         return False
 
+def _files_identical(path_a, path_b):
+    """Compare two files by blake2b digest, reading in 64 KB blocks."""
+    import hashlib
+
+    digests = []
+    for path in (path_a, path_b):
+        h = hashlib.blake2b()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                h.update(chunk)
+        digests.append(h.digest())
+    return digests[0] == digests[1]
+
+
 def apply_update(release_info):
     """Apply the downloaded update"""
     try:
+        import shutil  # only needed on the once-a-day update path
+
         updated_files = []
-        
-        # File replacement mapping
-        file_replacements = {
-            'app.py.new': 'app.py',
-            'index.html.new': 'index.html'
-        }
-        
-        for new_file, target_file in file_replacements.items():
-            new_file_path = os.path.abspath(new_file)
-            target_file_path = os.path.abspath(target_file)
-            
+        unchanged_files = []
+
+        for new_file_path, target_file_path in _FILE_REPLACEMENTS:
+            target_file = os.path.basename(target_file_path)
+
             if os.path.exists(new_file_path):
                 try:
-                    # Cross-platform file replacement
-                    if os.path.exists(target_file_path):
-                        if IS_WINDOWS:
-                            # On Windows, remove target first if it exists
-                            os.remove(target_file_path)
-                            shutil.move(new_file_path, target_file_path)
-                        else:
-                            # On Linux/Unix, os.replace works reliably
-                            os.replace(new_file_path, target_file_path)
-                    else:
-                        # Target doesn't exist, just rename
+                    # Skip the replace (and the eventual restart) when the
+                    # downloaded file is byte-identical to what's on disk
+                    if os.path.exists(target_file_path) and _files_identical(new_file_path, target_file_path):
+                        logger.info(f"{target_file} unchanged in this release, skipping replace")
+                        os.remove(new_file_path)
+                        unchanged_files.append(target_file)
+                        continue
+
+                    # os.replace is atomic on Linux and modern Windows alike,
+                    # so the target never briefly disappears mid-update
+                    try:
+                        os.replace(new_file_path, target_file_path)
+                    except OSError:
+                        # Cross-device rename (EXDEV) - fall back to a copy
                         shutil.move(new_file_path, target_file_path)
                     
                     updated_files.append(target_file)
@@ -866,8 +1406,9 @@ def apply_update(release_info):
                     except:
                         pass
         
-        if updated_files:
-            # Save new version info
+        if updated_files or unchanged_files:
+            # Save new version info (also when all content was identical, so
+            # the same release is not downloaded again tomorrow)
             version_data = {
                 'tag_name': release_info['tag_name'],
                 'updated_at': datetime.now().isoformat(),
@@ -875,9 +1416,13 @@ def apply_update(release_info):
                 'updated_files': updated_files
             }
             save_current_version(version_data)
-            
+
+            if not updated_files:
+                logger.info(f"Release {release_info['tag_name']} matches files on disk; no replace or restart needed")
+                return True
+
             logger.info(f"Successfully updated to version {release_info['tag_name']}")
-            
+
             # Check if app.py was updated (requires restart)
             app_py_updated = 'app.py' in updated_files
             
@@ -892,7 +1437,9 @@ def apply_update(release_info):
             # Schedule automatic restart if app.py was updated
             if app_py_updated:
                 logger.info(f"app.py was updated, scheduling restart in {RESTART_DELAY} seconds...")
-                threading.Thread(target=schedule_restart, daemon=True).start()
+                # Background task cooperates with the server's async loop
+                # (greenlet under eventlet, thread otherwise)
+                socketio.start_background_task(schedule_restart)
             
             return True
         else:
@@ -906,13 +1453,13 @@ def apply_update(release_info):
 def perform_update():
     """Check for updates and apply them if available"""
     logger.info("Checking for updates...")
-    
+
     try:
+        current_version = get_current_version()
         release_info = check_for_updates()
-        
+
         if not release_info:
             # No updates available - notify client and reset status
-            current_version = get_current_version()
             logger.info("No updates available")
             socketio.emit('update_check_complete', {
                 'updates_available': False,
@@ -923,9 +1470,8 @@ def perform_update():
             return False
         
         logger.info(f"Found new version: {release_info['tag_name']}")
-        
+
         # Updates available - notify client
-        current_version = get_current_version()
         socketio.emit('update_check_complete', {
             'updates_available': True,
             'current_version': current_version['tag_name'],
@@ -934,17 +1480,8 @@ def perform_update():
             'checked_at': datetime.now().isoformat()
         })
         
-        # Create backup
-        backup_dir = backup_current_files()
-        if not backup_dir:
-            logger.error("Failed to create backup, aborting update")
-            socketio.emit('update_error', {
-                'error': 'Backup-Erstellung fehlgeschlagen',
-                'message': 'Update abgebrochen'
-            })
-            return False
-        
-        # Download new files
+        # Download new files first so the backup can be skipped entirely
+        # when the release content is identical to what is already on disk
         if not download_release_files(release_info):
             logger.error("Failed to download release files")
             socketio.emit('update_error', {
@@ -952,7 +1489,26 @@ def perform_update():
                 'message': 'Update konnte nicht heruntergeladen werden'
             })
             return False
-        
+
+        changes_pending = any(
+            os.path.exists(new_file) and (
+                not os.path.exists(target_file)
+                or not _files_identical(new_file, target_file)
+            )
+            for new_file, target_file in _FILE_REPLACEMENTS
+        )
+
+        # Create backup (only when something will actually be replaced)
+        if changes_pending and BACKUP_ENABLED:
+            backup_dir = backup_current_files()
+            if not backup_dir:
+                logger.error("Failed to create backup, aborting update")
+                socketio.emit('update_error', {
+                    'error': 'Backup-Erstellung fehlgeschlagen',
+                    'message': 'Update abgebrochen'
+                })
+                return False
+
         # Apply update
         if apply_update(release_info):
             logger.info("Update completed successfully")
@@ -973,23 +1529,31 @@ def perform_update():
         })
         return False
 
+def _has_clients():
+    """Best-effort check whether any Socket.IO client is connected."""
+    try:
+        return bool(list(socketio.server.manager.get_participants('/', None)))
+    except Exception:
+        return True  # fail open: better a wasted emit than a missed one
+
+
 def schedule_restart():
     """Schedule automatic restart after app.py update"""
     try:
-        # Send countdown notifications to clients
-        for remaining in range(RESTART_DELAY, 0, -1):
-            socketio.emit('restart_countdown', {
-                'seconds_remaining': remaining,
-                'message': f'Server wird in {remaining} Sekunden neugestartet...'
+        # A single event carries the whole countdown; connected browsers run
+        # the per-second ticker locally instead of receiving one frame per
+        # second from the server (11 emits collapsed into 1). With no
+        # clients connected, even that one emit is skipped.
+        if _has_clients():
+            socketio.emit('restart_countdown_start', {
+                'duration': RESTART_DELAY,
+                'starts_at': time.time(),
+                'message': f'Server wird in {RESTART_DELAY} Sekunden neugestartet...'
             })
-            time.sleep(1)
-        
-        # Final notification
-        socketio.emit('restart_countdown', {
-            'seconds_remaining': 0,
-            'message': 'Server wird jetzt neugestartet...'
-        })
-        
+        # socketio.sleep cooperates with the async server instead of
+        # blocking a raw thread for the whole delay
+        socketio.sleep(RESTART_DELAY)
+
         logger.info("Initiating automatic restart...")
         time.sleep(2)  # Longer pause to ensure messages are sent
         
@@ -1004,6 +1568,93 @@ def schedule_restart():
             'error': str(e)
         })
 
+def check_pcsc_service():
+    """Quick diagnostic: check if pcscd / pyscard is installed and returns a reader list."""
+    try:
+        from smartcard.System import readers as sc_readers
+    except Exception:
+        logger.info('pyscard (smartcard) not installed: `pip install pyscard` to enable PC/SC checks')
+        return False
+
+    try:
+        r = sc_readers()
+        logger.debug('PC/SC readers available via pyscard: %s', r)
+        if not r:
+            # If running on Linux, hint to check the pcscd service
+            if IS_LINUX:
+                try:
+                    out = subprocess.check_output(['systemctl', 'is-active', 'pcscd'], stderr=subprocess.DEVNULL, universal_newlines=True)
+                    if out.strip() == 'active':
+                        logger.debug('pcscd service is active but no readers found - try unplug/replug the device or check udev rules')
+                    else:
+                        logger.warning('pcscd service appears inactive. Try: sudo systemctl enable --now pcscd')
+                except Exception:
+                    logger.debug('Could not detect pcscd service state - if on Linux, make sure pcscd/pcscd.service is installed and running')
+            return False
+        return True
+    except Exception as e:
+        logger.debug('PC/SC readers check failed: %s', e)
+        return False
+
+
+# Source of the port_wait_temp.py helper launched by the restart scripts.
+# One module-level constant shared by the Windows and Linux paths instead
+# of two identical f-string heredocs rebuilt on every restart.
+_PORT_WAIT_SCRIPT = """\
+import socket
+import time
+import sys
+
+def is_port_available(host='localhost', port=5000):
+    # bind probe: instant, and succeeds only once the OS would let a new
+    # listener take the port (connect probes misread TIME_WAIT as free).
+    # SO_REUSEADDR matches the real server's bind behaviour.
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind((host, port))
+                return True
+            except OSError:
+                return False
+    except Exception:
+        return True
+
+def wait_for_port_available(host='localhost', port=5000, max_wait_time=60):
+    # monotonic deadline: immune to wall-clock steps while we wait
+    start = time.monotonic()
+    deadline = start + max_wait_time
+    attempts = 0
+    # Exponential backoff: fast releases (~100ms) are caught within a few
+    # checks, slow ones cost ~15 syscalls over the full window instead of
+    # hundreds at a fixed interval
+    delay = 0.01
+    while time.monotonic() < deadline:
+        attempts += 1
+        if is_port_available(host, port):
+            print(f'Port {port} is now available (checked {attempts} times)')
+            return True
+        if attempts % 10 == 0:
+            elapsed = int(time.monotonic() - start)
+            print(f'Still waiting for port {port}... ({elapsed}s elapsed)')
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
+    print(f'Timeout: Port {port} still not available after {max_wait_time}s')
+    return False
+
+if __name__ == '__main__':
+    print('Checking if port 5000 is available...')
+    if wait_for_port_available():
+        # A successful bind means the OS will accept a new listener now -
+        # no extra settling delay needed
+        print('Port 5000 is available, ready to start new instance...')
+        sys.exit(0)
+    else:
+        print('Warning: Starting anyway after timeout')
+        sys.exit(0)
+"""
+
+
 def restart_application():
     """Restart the current Python application with proper Flask shutdown"""
     try:
@@ -1016,9 +1667,12 @@ def restart_application():
         except:
             pass
         
-        # Close any open resources gracefully
+        # Close any open resources gracefully. The update loop needs no
+        # wake-up: it runs on a daemon thread, so it cannot block process
+        # exit, and waking it here would only race a fresh update check
+        # against the shutdown.
         cleanup_nfc_reader()
-        
+
         # Get the current Python executable and script arguments
         python_executable = sys.executable
         script_args = sys.argv.copy()
@@ -1033,83 +1687,11 @@ def restart_application():
             logger.info(f"Windows restart command: {python_executable} {' '.join(script_args)}")
             
             try:
-                # Create a Python script for port waiting (more reliable than embedded code)
-                port_wait_script = f"""
-import socket
-import time
-import sys
-
-def is_port_available(host='localhost', port=5000, timeout=1):
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            return result != 0
-    except Exception:
-        return True
-
-
-    def check_pcsc_service():
-#        "Quick diagnostic: check if pcscd / pyscard is installed and returns a reader list."
-        try:
-            from smartcard.System import readers as sc_readers
-        except Exception:
-            logger.info('pyscard (smartcard) not installed: `pip install pyscard` to enable PC/SC checks')
-            return False
-
-        try:
-            r = sc_readers()
-            logger.debug(f'PC/SC readers available via pyscard: {r}')
-            if not r:
-                # If running on Linux, hint to check the pcscd service
-                if IS_LINUX:
-                    try:
-                        import subprocess
-                        out = subprocess.check_output(['systemctl', 'is-active', 'pcscd'], stderr=subprocess.DEVNULL, universal_newlines=True)
-                        if out.strip() == 'active':
-                            logger.debug('pcscd service is active but no readers found - try unplug/replug the device or check udev rules')
-                        else:
-                            logger.warning('pcscd service appears inactive. Try: sudo systemctl enable --now pcscd')
-                    except Exception:
-                        logger.debug('Could not detect pcscd service state - if on Linux, make sure pcscd/pcscd.service is installed and running')
-                return False
-            return True
-        except Exception as e:
-            logger.debug(f'PC/SC readers check failed: {e}')
-            return False
-
-def wait_for_port_available(host='localhost', port=5000, max_wait_time=60, check_interval=0.5):
-    start_time = time.time()
-    attempts = 0
-    while time.time() - start_time < max_wait_time:
-        attempts += 1
-        if is_port_available(host, port):
-            print(f'Port {{port}} is now available (checked {{attempts}} times)')
-            return True
-        if attempts % 4 == 0:  # Print status every 2 seconds
-            elapsed = int(time.time() - start_time)
-            print(f'Still waiting for port {{port}}... ({{elapsed}}s elapsed)')
-        time.sleep(check_interval)
-    print(f'Timeout: Port {{port}} still not available after {{max_wait_time}}s')
-    return False
-
-if __name__ == '__main__':
-    print('Checking if port 5000 is available...')
-    if wait_for_port_available():
-        print('Port 5000 is available, waiting additional 3 seconds for OS to fully release it...')
-        time.sleep(3)  # Additional delay to ensure OS fully releases the port
-        print('Ready to start new instance...')
-        sys.exit(0)
-    else:
-        print('Warning: Starting anyway after timeout')
-        sys.exit(0)
-"""
-                
-                # Write the port waiting Python script
+                # Write the shared port-wait helper script
                 port_wait_script_path = os.path.join(current_dir, "port_wait_temp.py")
                 with open(port_wait_script_path, 'w') as f:
-                    f.write(port_wait_script)
-                
+                    f.write(_PORT_WAIT_SCRIPT)
+
                 # Create a batch script that uses the Python script
                 restart_script = f"""
 @echo off
@@ -1146,17 +1728,13 @@ if %ERRORLEVEL% EQU 0 (
                     )
 
                 logger.info("🚀 Windows: Delayed restart script launched, shutting down current instance...")
-                
-                # Properly exit the Flask application instead of using os._exit()
-                # This allows the Flask server to properly release the port
-                time.sleep(2)  # Brief pause to ensure script is launched
-                
-                # Initiate graceful shutdown
+
+                # Stop the SocketIO server; the child port-wait script is
+                # what actually waits for the OS to release the port, so no
+                # settling sleeps are needed here (CPython closes sockets by
+                # refcount, not GC)
                 logger.info("💀 Initiating graceful Flask server shutdown...")
-                
-                # Method 1: Try to stop SocketIO server gracefully
                 try:
-                    logger.info("� Stopping SocketIO server...")
                     try:
                         stop_server()
                     except Exception:
@@ -1165,21 +1743,11 @@ if %ERRORLEVEL% EQU 0 (
                     logger.info("✅ SocketIO server stopped successfully")
                 except Exception as e:
                     logger.warning(f"⚠️  SocketIO stop failed: {e}")
-                
-                # Method 2: Give time for connections to close
-                time.sleep(1)
-                
-                # Method 3: Force close any remaining sockets (Windows specific)
-                try:
-                    import gc
-                    gc.collect()  # Force garbage collection to clean up sockets
-                except:
-                    pass
-                
-                # Method 4: Exit cleanly to allow OS to reclaim port
+
+                # One short yield so buffered outbound messages flush
+                socketio.sleep(0.1)
+
                 logger.info("🔚 Exiting application process cleanly...")
-                
-                # Use sys.exit() instead of os._exit() for cleaner shutdown
                 if DRY_RUN:
                     logger.info("DRY RUN: Skipping process exit during restart (Windows)")
                 else:
@@ -1197,53 +1765,11 @@ if %ERRORLEVEL% EQU 0 (
                 # Create a shell script with extended port waiting
                 current_dir = os.getcwd()
                 
-                # Create a Python script for port waiting (consistent with Windows approach)
-                port_wait_script = f"""
-import socket
-import time
-import sys
-
-def is_port_available(host='localhost', port=5000, timeout=1):
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            return result != 0
-    except Exception:
-        return True
-
-def wait_for_port_available(host='localhost', port=5000, max_wait_time=60, check_interval=0.5):
-    start_time = time.time()
-    attempts = 0
-    while time.time() - start_time < max_wait_time:
-        attempts += 1
-        if is_port_available(host, port):
-            print(f'Port {{port}} is now available (checked {{attempts}} times)')
-            return True
-        if attempts % 4 == 0:  # Print status every 2 seconds
-            elapsed = int(time.time() - start_time)
-            print(f'Still waiting for port {{port}}... ({{elapsed}}s elapsed)')
-        time.sleep(check_interval)
-    print(f'Timeout: Port {{port}} still not available after {{max_wait_time}}s')
-    return False
-
-if __name__ == '__main__':
-    print('Checking if port 5000 is available...')
-    if wait_for_port_available():
-        print('Port 5000 is available, waiting additional 3 seconds for OS to fully release it...')
-        time.sleep(3)  # Additional delay to ensure OS fully releases the port
-        print('Ready to start new instance...')
-        sys.exit(0)
-    else:
-        print('Warning: Starting anyway after timeout')
-        sys.exit(0)
-"""
-                
-                # Write the port waiting Python script
+                # Write the shared port-wait helper script
                 port_wait_script_path = os.path.join(current_dir, "port_wait_temp.py")
                 with open(port_wait_script_path, 'w') as f:
-                    f.write(port_wait_script)
-                
+                    f.write(_PORT_WAIT_SCRIPT)
+
                 # Create a shell script that uses the Python script
                 restart_script = f"""#!/bin/bash
 echo "Waiting for port 5000 to become available..."
@@ -1281,16 +1807,13 @@ fi
                     )
 
                 logger.info("🚀 Linux: Delayed restart script launched, shutting down current instance...")
-                
-                # Properly exit the Flask application instead of using os._exit()
-                time.sleep(2)  # Brief pause to ensure script is launched
-                
-                # Initiate graceful shutdown
+
+                # Stop the SocketIO server; the child port-wait script is
+                # what actually waits for the OS to release the port, so no
+                # settling sleeps are needed here (CPython closes sockets by
+                # refcount, not GC)
                 logger.info("💀 Initiating graceful Flask server shutdown...")
-                
-                # Method 1: Try to stop SocketIO server gracefully
                 try:
-                    logger.info("� Stopping SocketIO server...")
                     try:
                         stop_server()
                     except Exception:
@@ -1298,18 +1821,10 @@ fi
                     logger.info("✅ SocketIO server stopped successfully")
                 except Exception as e:
                     logger.warning(f"⚠️  SocketIO stop failed: {e}")
-                
-                # Method 2: Give time for connections to close
-                time.sleep(1)
-                
-                # Method 3: Force garbage collection to clean up sockets
-                try:
-                    import gc
-                    gc.collect()
-                except:
-                    pass
-                
-                # Method 4: Exit cleanly using sys.exit() to allow proper cleanup
+
+                # One short yield so buffered outbound messages flush
+                socketio.sleep(0.1)
+
                 logger.info("� Exiting application process cleanly...")
                 if DRY_RUN:
                     logger.info("DRY RUN: Skipping process exit during restart (Linux)")
@@ -1336,12 +1851,18 @@ fi
         except Exception as e2:
             logger.error(f"Fallback restart also failed: {e2}")
 
+# Wakes update_check_loop early: set by the manual check handler (run the
+# check now instead of spawning a second updater thread) and on restart so
+# the loop isn't parked in an uninterruptible day-long sleep.
+_UPDATE_WAKE = threading.Event()
+
+
 def update_check_loop():
     """Background thread to periodically check for updates"""
     if not AUTO_UPDATE_ENABLED:
         logger.info("Auto-update is disabled, update check loop will not run")
         return
-    
+
     logger.info("Auto-update check loop started")
     while True:
         try:
@@ -1353,9 +1874,11 @@ def update_check_loop():
                 break
         except Exception as e:
             logger.error(f"Error in update check loop: {e}")
-        
-        # Wait for next check
-        time.sleep(UPDATE_CHECK_INTERVAL)
+
+        # Wait for next check; an Event.wait returns early (True) when a
+        # manual check or shutdown sets the wake flag
+        if _UPDATE_WAKE.wait(UPDATE_CHECK_INTERVAL):
+            _UPDATE_WAKE.clear()
 
 @socketio.on('check_for_updates')
 def handle_check_for_updates():
@@ -1369,7 +1892,9 @@ def handle_check_for_updates():
         return
     
     logger.info("Manual update check requested")
-    threading.Thread(target=perform_update, daemon=True).start()
+    # Wake the existing update loop instead of spawning a second updater
+    # thread that could race a scheduled check
+    _UPDATE_WAKE.set()
 
 @socketio.on('get_version_info')
 def handle_get_version_info():
@@ -1379,34 +1904,39 @@ def handle_get_version_info():
     version_info['auto_update_enabled'] = AUTO_UPDATE_ENABLED
     logger.info(f"📡 Sending version info to client: {version_info}")
     logger.info(f"🏷️  Tag name being sent: '{version_info.get('tag_name')}'")
-    socketio.emit('version_info', version_info)
+    # Reply only to the requesting client - broadcasting would push the
+    # answer to every connected screen
+    socketio.emit('version_info', version_info, to=request.sid)
     logger.info("✅ Version info emission completed")
 
 @socketio.on('reinitialize_nfc_reader')
 def handle_reinitialize_nfc_reader():
     """Manual NFC reader reinitialization triggered by client"""
     logger.info("Manual NFC reader reinitialization requested")
-    
+    # request.sid is only valid inside the handler - capture it before the
+    # worker thread starts so the reply targets the requester
+    sid = request.sid
+
     def reinit_reader():
         try:
             cleanup_nfc_reader()
             time.sleep(1)  # Brief pause
             success = test_nfc_reader_availability()
-            
+
             socketio.emit('nfc_reader_reinit_result', {
                 'success': success,
                 'message': 'NFC-Lesegerät erfolgreich neu initialisiert' if success else 'NFC-Lesegerät Initialisierung fehlgeschlagen',
                 'os': OS_NAME
-            })
+            }, to=sid)
         except Exception as e:
             logger.error(f"Error during manual NFC reader reinitialization: {e}")
             socketio.emit('nfc_reader_reinit_result', {
                 'success': False,
                 'message': f'Fehler bei Neuinitialisierung: {str(e)}',
                 'os': OS_NAME
-            })
-    
-    threading.Thread(target=reinit_reader, daemon=True).start()
+            }, to=sid)
+
+    _BG_POOL.submit(reinit_reader)
 
 @socketio.on('get_nfc_reader_status')
 def handle_get_nfc_reader_status():
@@ -1415,26 +1945,36 @@ def handle_get_nfc_reader_status():
         'available': nfc_reader_available,
         'reader_exists': reader is not None,
         'os': OS_NAME
-    })
+    }, to=request.sid)
 
 def is_port_available(host='localhost', port=5000, timeout=1):
     """
     Check if a specific port is available (not in use).
-    
+
+    Probes with bind() instead of connect(): bind answers in microseconds,
+    never waits on a timeout, and reports the thing we actually care about -
+    whether our own listen socket could take the port (a TIME_WAIT socket
+    refuses connects AND binds, which connect_ex misreads as "available").
+
     Args:
         host (str): Host to check (default: localhost)
         port (int): Port number to check (default: 5000)
-        timeout (int): Connection timeout in seconds
-        
+        timeout (int): Unused, kept for call-site compatibility
+
     Returns:
         bool: True if port is available, False if in use
     """
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            # If connection fails, port is available
-            return result != 0
+            # SO_REUSEADDR mirrors how the real server binds, so a lingering
+            # TIME_WAIT socket doesn't make the probe report "in use" after
+            # the old listener is already gone
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind((host, port))
+                return True
+            except OSError:
+                return False
     except Exception:
         # If any error occurs, assume port is available
         return True
@@ -1456,10 +1996,15 @@ def _parse_netstat_windows_port_pids(port: int):
                     except Exception:
                         pass
     except Exception as e:
-        logger.debug(f"Windows netstat failed: {e}")
+        logger.debug("Windows netstat failed: %s", e)
     return pids
 
 
+# Compiled once: the ss fallback runs the same pid=NNN extraction on every
+# matching line, and operating on bytes skips decoding the whole output
+_SS_PID_RE = re.compile(rb'pid=(\d+)')
+
+
 def _get_pids_using_port_linux(port: int):
     """Return a set of PIDs using `lsof` or `ss` on Linux/Unix for the given port."""
     pids = set()
@@ -1477,32 +2022,68 @@ def _get_pids_using_port_linux(port: int):
     except Exception:
         # fallback to ss for listening ports
         try:
-            out = subprocess.check_output(['ss', '-ltnp'], stderr=subprocess.DEVNULL, universal_newlines=True)
+            out = subprocess.check_output(['ss', '-ltnp'], stderr=subprocess.DEVNULL)
+            port_space = f':{port} '.encode()
+            port_colon = f':{port}:'.encode()
             for line in out.splitlines():
-                if f':{port} ' in line or f':{port}:' in line:
-                    # attempt to parse 'pid=1234,' pattern in the line
-                    if 'pid=' in line:
-                        try:
-                            # find substring between pid= and comma
-                            start = line.find('pid=') + 4
-                            end = line.find(',', start)
-                            if end == -1:
-                                end = len(line)
-                            pid = int(line[start:end])
-                            pids.add(pid)
-                        except Exception:
-                            pass
+                if port_space in line or port_colon in line:
+                    for m in _SS_PID_RE.finditer(line):
+                        pids.add(int(m.group(1)))
         except Exception as e:
-            logger.debug(f"ss fallback failed: {e}")
+            logger.debug("ss fallback failed: %s", e)
     return pids
 
 
+def _get_pids_using_port_psutil(port: int):
+    """Return PIDs bound to a TCP port via psutil's connection table."""
+    return {
+        c.pid for c in psutil.net_connections(kind='tcp')
+        if c.pid and c.laddr and c.laddr.port == port
+    }
+
+
+# Platform dispatch resolved once at import instead of per call
+_get_pids_using_port_os = _parse_netstat_windows_port_pids if IS_WINDOWS else _get_pids_using_port_linux
+
+
 def get_pids_using_port(port: int):
     """Return a list of OS PIDs using the specified TCP port (best-effort)."""
-    if IS_WINDOWS:
-        return _parse_netstat_windows_port_pids(port)
-    else:
-        return _get_pids_using_port_linux(port)
+    if psutil is not None:
+        try:
+            return _get_pids_using_port_psutil(port)
+        except Exception as e:
+            logger.debug("psutil port lookup failed: %s", e)
+    return _get_pids_using_port_os(port)
+
+
+def _wait_for_pid_exit(pid: int, budget: float = 1.0) -> bool:
+    """Wait (bounded) for a non-child PID to exit.
+
+    On Linux with pidfd support this blocks in select() and returns the
+    moment the process exits; elsewhere it polls kill(pid, 0) with an
+    exponential backoff from 5ms up to 200ms, so a fast exit is seen
+    within milliseconds instead of rounding up to a fixed 100ms step.
+    """
+    if hasattr(os, 'pidfd_open'):
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:
+            return True  # already gone
+        try:
+            readable, _, _ = select.select([fd], [], [], budget)
+            return bool(readable)
+        finally:
+            os.close(fd)
+    deadline = time.monotonic() + budget
+    delay = 0.005
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    return False
 
 
 def kill_pid(pid: int, wait: bool = False):
@@ -1517,12 +2098,7 @@ def kill_pid(pid: int, wait: bool = False):
         else:
             os.kill(pid, 15)  # SIGTERM
             if wait:
-                for _ in range(10):
-                    try:
-                        os.kill(pid, 0)
-                        time.sleep(0.1)
-                    except OSError:
-                        return True
+                _wait_for_pid_exit(pid)
             return True
     except Exception as e:
         try:
@@ -1531,7 +2107,7 @@ def kill_pid(pid: int, wait: bool = False):
                 os.kill(pid, 9)  # SIGKILL
                 return True
         except Exception:
-            logger.debug(f"Failed to kill PID {pid}: {e}")
+            logger.debug("Failed to kill PID %s: %s", pid, e)
         return False
 
 
@@ -1544,30 +2120,65 @@ def kill_processes_using_port(port: int, exclude_current: bool = True, dry_run:
         current_pid = os.getpid() if exclude_current else None
         pids = get_pids_using_port(port)
         if not pids:
-            logger.debug(f"No processes found using port {port}")
+            logger.debug("No processes found using port %s", port)
+            return ([], [])
+
+        logger.info(f"Found processes using port {port}: {pids}")
+        if exclude_current and current_pid in pids:
+            logger.info(f"Skipping own PID {current_pid}")
+        targets = [pid for pid in pids if not (exclude_current and pid == current_pid)]
+        if not targets:
             return ([], [])
+        if dry_run:
+            logger.info(f"DRY RUN: Would kill PIDs: {targets}")
+            return ([], targets)
 
         killed = []
         failed = []
-        logger.info(f"Found processes using port {port}: {pids}")
-        for pid in pids:
-            if exclude_current and pid == current_pid:
-                logger.info(f"Skipping own PID {pid}")
-                continue
+        if IS_WINDOWS:
+            # taskkill accepts many /PID arguments - one process launch for
+            # the whole batch instead of one per PID
+            cmd = ['taskkill', '/F']
+            for pid in targets:
+                cmd += ['/PID', str(pid)]
             try:
-                logger.info(f"Attempting to kill PID {pid} using port {port}")
-                if dry_run:
-                    logger.info(f"DRY RUN: Would kill PID: {pid}")
+                subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                killed = list(targets)
+            except Exception:
+                # Batch failed (e.g. one stale PID fails the whole call) -
+                # retry individually so the rest still go down
+                for pid in targets:
+                    (killed if kill_pid(pid) else failed).append(pid)
+        else:
+            # Signal everyone first, then run one shared wait loop instead
+            # of a per-PID sleep ladder
+            signalled = []
+            for pid in targets:
+                try:
+                    os.kill(pid, 15)  # SIGTERM
+                    signalled.append(pid)
+                except Exception as e:
+                    logger.warning(f"Failed to signal {pid}: {e}")
                     failed.append(pid)
-                    continue
-                ok = kill_pid(pid, wait=True)
-                if ok:
+            deadline = time.monotonic() + 1.0
+            while signalled and time.monotonic() < deadline:
+                still_alive = []
+                for pid in signalled:
+                    try:
+                        os.kill(pid, 0)
+                        still_alive.append(pid)
+                    except OSError:
+                        killed.append(pid)
+                signalled = still_alive
+                if signalled:
+                    time.sleep(0.1)
+            for pid in signalled:
+                # Escalate stragglers, same as kill_pid's fallback
+                try:
+                    os.kill(pid, 9)  # SIGKILL
                     killed.append(pid)
-                else:
+                except Exception:
                     failed.append(pid)
-            except Exception as e:
-                failed.append(pid)
-                logger.warning(f"Failed to kill {pid}: {e}")
 
         return (killed, failed)
     except Exception as e:
@@ -1587,23 +2198,39 @@ def wait_for_port_available(host='localhost', port=5000, max_wait_time=30, check
     Returns:
         bool: True if port became available, False if timeout reached
     """
-    start_time = time.time()
-    while time.time() - start_time < max_wait_time:
+    # monotonic: immune to NTP clock steps while we wait
+    deadline = time.monotonic() + max_wait_time
+
+    # Fast path: a port freed by a just-killed process usually comes back
+    # within milliseconds, so spend a tiny bounded spin before committing
+    # to sleep-sized waits
+    spin_deadline = time.monotonic() + 0.002
+    while time.monotonic() < spin_deadline:
+        if is_port_available(host, port):
+            return True
+        time.sleep(0)  # yield without arming a timer
+
+    # Slow path: back off towards check_interval for genuinely slow releases
+    delay = 0.01
+    while time.monotonic() < deadline:
         if is_port_available(host, port):
             return True
-        time.sleep(check_interval)
+        time.sleep(delay)
+        delay = min(delay * 2, check_interval)
     return False
 
 def cleanup_temporary_files():
     """Clean up temporary restart script files"""
-    try:
-        temp_files = ["restart_temp.bat", "restart_temp.sh", "port_wait_temp.py"]
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-                logger.debug(f"Cleaned up temporary file: {temp_file}")
-    except Exception as e:
-        logger.debug(f"Error cleaning temporary files: {e}")
+    # EAFP: remove directly instead of stat-then-remove - one syscall per
+    # file and no window for the file to vanish between the two calls
+    for temp_file in ("restart_temp.bat", "restart_temp.sh", "port_wait_temp.py"):
+        try:
+            os.remove(temp_file)
+            logger.debug("Cleaned up temporary file: %s", temp_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Error cleaning temporary file %s: %s", temp_file, e)
 
 if __name__ == '__main__':
     # Parse command line arguments first
@@ -1612,6 +2239,12 @@ if __name__ == '__main__':
     if hasattr(args, 'dry_run') and args.dry_run:
         DRY_RUN = True
         logger.info('Dry-run mode enabled; actions will be simulated and no processes will be killed or scripts launched')
+    if getattr(args, 'cache_ttl', None) is not None:
+        VALIDATION_CACHE_TTL = args.cache_ttl
+        logger.info(f'Validation cache TTL set to {VALIDATION_CACHE_TTL}s via command line')
+    if hasattr(args, 'no_backup') and args.no_backup:
+        BACKUP_ENABLED = False
+        logger.info('Pre-update backups disabled via command line flag')
     # Apply new flags
     if hasattr(args, 'no_beep') and args.no_beep:
         DISABLE_READER_BEEP = True
@@ -1623,17 +2256,19 @@ if __name__ == '__main__':
     # Clean up any leftover temporary restart scripts
     cleanup_temporary_files()
     
-    logger.info("=" * 60)
-    logger.info("Starting NFC Reader Application")
-    logger.info(f"Operating System: {OS_NAME}")
-    logger.info(f"Python Version: {sys.version}")
-    logger.info(f"Working Directory: {os.getcwd()}")
-    logger.info(f"Auto-Update: {'✅ Enabled' if AUTO_UPDATE_ENABLED else '🚫 Disabled'}")
-    
-    # Show current version
+    # One multi-line record instead of eight: a single handler lock
+    # acquire and write for the whole banner
     current_version = get_current_version()
-    logger.info(f"Current version: {current_version['tag_name']}")
-    logger.info("=" * 60)
+    logger.info("\n".join([
+        "=" * 60,
+        "Starting NFC Reader Application",
+        f"Operating System: {OS_NAME}",
+        f"Python Version: {sys.version}",
+        f"Working Directory: {os.getcwd()}",
+        f"Auto-Update: {'✅ Enabled' if AUTO_UPDATE_ENABLED else '🚫 Disabled'}",
+        f"Current version: {current_version['tag_name']}",
+        "=" * 60,
+    ]))
     # Check PC/SC availability and log hints for troubleshooting
     try:
         pcsc_ok = check_pcsc_service()
@@ -1643,22 +2278,25 @@ if __name__ == '__main__':
     except Exception:
         logger.debug('PC/SC check skipped due to lack of pyscard or systemctl detection')
     
-    # Start card monitoring thread (it will handle NFC reader initialization)
-    monitoring_thread = threading.Thread(target=card_check_loop, daemon=True)
-    monitoring_thread.start()
-    logger.info("Card monitoring thread started")
+    # Start card monitoring (event-driven via pyscard when available,
+    # polling thread otherwise); keep the returned handle alive
+    card_monitoring = start_card_monitoring()
+    logger.info("Card monitoring started")
 
     # Start backend health monitoring thread
     health_thread = threading.Thread(target=backend_health_loop, daemon=True)
     health_thread.start()
     logger.info("Backend health monitoring thread started")
 
+    # Warm the DNS cache for the hosts we talk to (off the main thread)
+    threading.Thread(target=_prewarm_dns, daemon=True).start()
+
     # Quick initial check to set backend_online and notify clients immediately
     try:
         try:
-            r = requests.head(DATABASE_URL, timeout=2)
+            r = _SESSION.head(DATABASE_URL, timeout=2)
         except Exception:
-            r = requests.get(DATABASE_URL, timeout=2)
+            r = _SESSION.get(DATABASE_URL, timeout=2)
         backend_online = 200 <= r.status_code < 500
         socketio.emit('validation_backend_status', {'online': backend_online, 'message': 'Initial backend check', 'timestamp': time.time()})
     except Exception:
@@ -1701,7 +2339,7 @@ if __name__ == '__main__':
                 # Give a brief pause for OS to reclaim the port
                 time.sleep(0.5)
     else:
-        logger.debug(f"Port {flask_port} is immediately available")
+        logger.debug("Port %s is immediately available", flask_port)
     
     # Start Flask server with retry logic for port conflicts
     max_startup_attempts = 5
@@ -1739,7 +2377,12 @@ if __name__ == '__main__':
                     # Wait briefly for OS to reclaim port
                     time.sleep(0.5)
                 if startup_attempt < max_startup_attempts:
-                    wait_time = 10 + (startup_attempt * 5)  # Increasing wait time: 15s, 20s, 25s, 30s
+                    # Geometric backoff capped at 16s: 2s, 4s, 8s, 16s. The
+                    # port is usually released well within a few seconds of
+                    # the old process dying, and wait_for_port_available
+                    # returns the moment the bind probe succeeds anyway, so
+                    # the fixed 15-30s ladders only stretched worst cases.
+                    wait_time = min(2 ** startup_attempt, 16)
                     logger.info(f"⏳ Waiting {wait_time} seconds before retry attempt {startup_attempt + 1}...")
                     
                     # Wait for port to become available
@@ -1,7 +1,10 @@
-from selenium import webdriver
+# selenium is imported inside each test so that merely importing this module
+# (e.g. from a collection run) doesn't pay the webdriver import cost
 
 
 def test_basic_service():
+    from selenium import webdriver
+
     service = webdriver.FirefoxService()
     driver = webdriver.Firefox(service=service)
 
@@ -9,6 +12,8 @@ def test_basic_service():
 
 
 def test_driver_location(firefoxdriver_bin, firefox_bin):
+    from selenium import webdriver
+
     options = get_default_firefox_options()
     options.binary_location = firefox_bin
 
@@ -20,6 +25,8 @@ def test_driver_location(firefoxdriver_bin, firefox_bin):
 
 
 def test_driver_port():
+    from selenium import webdriver
+
     service = webdriver.FirefoxService(port=1234)
 
     driver = webdriver.Firefox(service=service)
@@ -28,15 +35,19 @@ def test_driver_port():
 
 
 def get_default_firefox_options():
+    from selenium import webdriver
+
     options = webdriver.FirefoxOptions()
     options.add_argument("--no-sandbox")
     return options
 
 def get_default_chrome_options():
+    from selenium import webdriver
+
     options = webdriver.ChromeOptions()
     options.add_argument("--no-sandbox")
     return options
 
 test_basic_service()
 test_driver_location()
-test_driver_port()
\ No newline at end of file
+test_driver_port()
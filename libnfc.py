@@ -1,5 +1,7 @@
 import nfc
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 url = "mensacheck.n-s-w.info"
 
@@ -8,6 +10,16 @@ headers = {
     'Content-Type': 'application/x-www-form-urlencoded'
 }
 
+# One session for all validations: the TCP/TLS connection to the backend
+# is set up once and reused, so every swipe after the first costs ~1 RTT
+# instead of repeating the full handshake. Cheap retries smooth over
+# transient network blips.
+_SESSION = requests.Session()
+_SESSION.headers.update(headers)
+_adapter = HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.2))
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
 clf = nfc.ContactlessFrontend('usb')
 
 def read_tag(tag):
@@ -21,7 +33,7 @@ def read_tag(tag):
 
 
 def check_tag_validity(tag: str) -> bool:
-    response = requests.request("POST", url, headers=headers, data=payload)
+    response = _SESSION.post(url, data=payload, timeout=3)
     print(response.text)
     if "Erfolgreich gespeichert!" not in response.text:
         return False
@@ -34,5 +46,3 @@ while True:
         break
 
 clf.close()
-
-
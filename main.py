@@ -1,32 +1,67 @@
 #!/usr/bin/env python3
+"""Read card UIDs over a persistent PC/SC connection.
+
+Invoked from a terminal it prints a single UID (or status token) and
+exits, same as before. Driven over a pipe, each input line triggers
+another read on the same open connection, so repeated reads skip the
+~10-50ms PC/SC connect() cost and pay only the APDU transmit.
+"""
+import sys
+
 from smartcard.System import readers
-from smartcard.util import toHexString
 from smartcard.Exceptions import NoCardException, CardConnectionException
 
-try:
-    r = readers()
-    if len(r) == 0:
-        print("NO_READERS")
-        exit(1)
-    
-    conn = r[0].createConnection()
+GET_UID = [0xFF, 0xCA, 0x00, 0x00, 0x00]
+
+
+def main():
     try:
-        conn.connect()
-        GET_UID = [0xFF, 0xCA, 0x00, 0x00, 0x00]
-        response, sw1, sw2 = conn.transmit(GET_UID)
-        if sw1 == 0x90 and sw2 == 0x00:
-            print(toHexString(response))
-        else:
-            print("ERROR")
-    except NoCardException:
-        print("NO_CARD")
-    except CardConnectionException:
-        print("CONNECT_ERROR")
-    finally:
+        r = readers()
+        if len(r) == 0:
+            print("NO_READERS")
+            return 1
+
+        conn = r[0].createConnection()
+        connected = False
+
+        def read_once():
+            nonlocal connected
+            try:
+                if not connected:
+                    conn.connect()
+                    connected = True
+                response, sw1, sw2 = conn.transmit(GET_UID)
+                if sw1 == 0x90 and sw2 == 0x00:
+                    print(bytes(response).hex().upper())
+                else:
+                    print("ERROR")
+            except NoCardException:
+                # Per-request error: the connection object stays usable,
+                # the next request reconnects when a card is back
+                connected = False
+                print("NO_CARD")
+            except CardConnectionException:
+                connected = False
+                print("CONNECT_ERROR")
+            sys.stdout.flush()
+
+        read_once()
+        if not sys.stdin.isatty():
+            # Helper mode: one read per input line until EOF or 'exit'
+            for line in sys.stdin:
+                if line.strip().lower() == 'exit':
+                    break
+                read_once()
+
         try:
             conn.disconnect()
-        except:
+        except Exception:
             pass
-except Exception as e:
-    print(f"EXCEPTION: {e}")
-    exit(1)
\ No newline at end of file
+        return 0
+    except Exception as e:
+        print(f"EXCEPTION: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
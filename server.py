@@ -8,6 +8,21 @@ the server can be started/restarted without causing circular imports.
 
 This file exposes helpers to run and stop the server.
 """
+# Prefer eventlet's cooperative server when it is installed: SocketIO emits
+# become non-blocking greenlet writes, so one slow browser can no longer
+# stall the card loop's broadcasts. The entry point (app.py) patches the
+# interpreter as its very first statement, before requests/flask pull in
+# socket and ssl; the guard here only patches when server.py is imported
+# standalone, and never re-patches an already-patched interpreter.
+try:
+    import eventlet
+    if not eventlet.patcher.is_monkey_patched('socket'):
+        eventlet.monkey_patch()
+    _ASYNC_MODE = 'eventlet'
+except ImportError:
+    eventlet = None
+    _ASYNC_MODE = 'threading'
+
 from flask import Flask
 from flask_socketio import SocketIO
 import logging
@@ -16,10 +31,32 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Encode Socket.IO packets with orjson when it is installed: every emit
+# goes through this serializer, and orjson's C encoder is severalfold
+# faster than the stdlib one. The shim exists because orjson returns
+# bytes while the packet layer expects str, and extra keyword arguments
+# (separators etc.) must be tolerated and ignored - orjson is always
+# compact.
+try:
+    import orjson
+
+    class _OrjsonShim:
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        @staticmethod
+        def loads(data, **kwargs):
+            return orjson.loads(data)
+
+    _JSON_MODULE = _OrjsonShim
+except ImportError:
+    _JSON_MODULE = None  # SocketIO falls back to Flask's JSON handling
+
 # Create Flask application and SocketIO instance here so other modules can
 # import them without starting the server automatically.
 app = Flask(__name__)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=_ASYNC_MODE, json=_JSON_MODULE)
 
 
 def run_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False) -> None:
@@ -30,8 +67,12 @@ def run_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False) ->
         port: Port to bind to
         debug: Run in debug mode
     """
-    logger.info(f"Starting Flask-SocketIO server on {host}:{port} (debug={debug})")
-    socketio.run(app, host=host, port=port, allow_unsafe_werkzeug=True, debug=debug)
+    logger.info(f"Starting Flask-SocketIO server on {host}:{port} (debug={debug}, async_mode={socketio.async_mode})")
+    if _ASYNC_MODE == 'eventlet':
+        # eventlet's native server; allow_unsafe_werkzeug is not needed here
+        socketio.run(app, host=host, port=port, debug=debug)
+    else:
+        socketio.run(app, host=host, port=port, allow_unsafe_werkzeug=True, debug=debug)
 
 
 def stop_server() -> None:
@@ -44,7 +85,7 @@ def stop_server() -> None:
     try:
         socketio.stop()
     except Exception as e:
-        logger.debug(f"Error stopping server: {e}")
+        logger.debug("Error stopping server: %s", e)
 
 
 # Optional background thread management
@@ -4,80 +4,160 @@
 Simple test for the Flask startup retry mechanism without Unicode issues.
 """
 
+import contextlib
+import errno
+import io
+import multiprocessing
+import random
+import selectors
 import socket
 import time
 import threading
-import subprocess
 import sys
 import os
-import tempfile
 
-def create_port_blocker(port=5000, duration=8):
-    """Create a server that blocks a port for testing"""
-    def block_port():
-        try:
-            print(f"Blocking port {port} for {duration} seconds...")
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                sock.bind(('localhost', port))
-                sock.listen(1)
-                time.sleep(duration)
-                print(f"Releasing port {port}")
-        except Exception as e:
-            print(f"Error in port blocker: {e}")
-    
-    thread = threading.Thread(target=block_port, daemon=True)
-    thread.start()
-    return thread
+class _PortBlock:
+    """Handle for a held port: release() frees it, hold() re-binds it."""
 
-def test_startup_retry():
-    """Test the startup retry mechanism"""
-    print("\n" + "="*60)
-    print("Testing Flask Startup Retry Mechanism")
-    print("="*60)
-    
-    # Create a simple test script without emojis
-    test_script = """
-import socket
-import time
-import sys
+    def __init__(self, port):
+        self.port = port
+        self._sock = None
+
+    def hold(self):
+        if self._sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # SO_REUSEPORT lets the next bind go through immediately
+            # even if this socket lingers in TIME_WAIT after release
+            if hasattr(socket, 'SO_REUSEPORT'):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.bind(('localhost', self.port))
+            sock.listen(1)
+            self._sock = sock
+            print(f"Blocking port {self.port}...")
+
+    def release(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            print(f"Releasing port {self.port}")
+
+
+@contextlib.contextmanager
+def port_blocked(port=5000):
+    """Hold a port for the duration of the with-block.
+
+    Yields only after listen() has returned, so tests don't need the old
+    'start a blocker thread and sleep a second hoping it bound' dance.
+    """
+    block = _PortBlock(port)
+    block.hold()
+    try:
+        yield block
+    finally:
+        block.release()
 
 def is_port_available(host='localhost', port=5000, timeout=1):
+    # Two-phase probe: bind+listen answers "could we take the port",
+    # the follow-up connect catches a racing bind between the phases
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            return result != 0
-    except Exception:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+            sock.listen(1)
+    except OSError:
+        return False
+    try:
+        with socket.create_connection((host, port), timeout=0.05):
+            return False
+    except (OSError, OverflowError):
         return True
 
 def wait_for_port_available(host='localhost', port=5000, max_wait_time=60, check_interval=0.5):
-    start_time = time.time()
+    # Full-jitter exponential backoff: fast releases are caught within
+    # tens of ms, slow ones decay towards check_interval, and concurrent
+    # waiters don't synchronize on the same tick
+    start = time.monotonic()
+    deadline = start + max_wait_time
     attempts = 0
-    while time.time() - start_time < max_wait_time:
+    last_log = start
+    while time.monotonic() < deadline:
         attempts += 1
         if is_port_available(host, port):
             print(f'Port {port} is now available (checked {attempts} times)')
             return True
-        if attempts % 4 == 0:
-            elapsed = int(time.time() - start_time)
-            print(f'Still waiting for port {port}... ({elapsed}s elapsed)')
-        time.sleep(check_interval)
+        now = time.monotonic()
+        if now - last_log > 2.0:
+            print(f'Still waiting for port {port}... ({int(now - start)}s elapsed)')
+            last_log = now
+        delay = min(check_interval, 0.01 * 2 ** min(attempts, 6))
+        time.sleep(random.uniform(0, delay))
     print(f'Timeout: Port {port} still not available after {max_wait_time}s')
     return False
 
+def find_available_port(host='localhost', ports=(5001, 5002, 5003, 5004, 5005), timeout=0.2):
+    """Probe candidate ports concurrently; return the first free one or None.
+
+    One non-blocking connect per candidate, all registered on a single
+    selector, so N probes share one timeout window instead of paying N
+    serial ones. A refused connect means nothing listens there; the
+    winner is confirmed with the authoritative bind probe before being
+    returned.
+    """
+    sel = selectors.DefaultSelector()
+    pending = {}
+    try:
+        for port in ports:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.setblocking(False)
+            err = s.connect_ex((host, port))
+            if err == 0:  # connected immediately: something listens, skip
+                s.close()
+                continue
+            if err == errno.ECONNREFUSED:
+                s.close()
+                if is_port_available(host, port):
+                    return port
+                continue
+            # EINPROGRESS/EWOULDBLOCK: result arrives via the selector
+            pending[s] = port
+            sel.register(s, selectors.EVENT_WRITE)
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                s = key.fileobj
+                port = pending.pop(s)
+                sel.unregister(s)
+                err = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                s.close()
+                if err == errno.ECONNREFUSED and is_port_available(host, port):
+                    return port
+        return None
+    finally:
+        for s in list(pending):
+            sel.unregister(s)
+            s.close()
+        sel.close()
+
 def simulate_flask_startup():
     max_attempts = 3
     attempt = 0
     flask_port = 5000
-    
+
     while attempt < max_attempts:
         attempt += 1
-        
+
         try:
             print(f"Flask startup attempt {attempt}/{max_attempts} on port {flask_port}")
-            
-            # Try to bind to the port (simulating Flask startup)
+
+            # Try to bind to the port (simulating Flask startup). No
+            # SO_REUSEPORT here: the real server doesn't set it, and with
+            # it the bind would share the port with the blocker and the
+            # conflict test would never conflict.
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as test_sock:
                 test_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 test_sock.bind(('localhost', flask_port))
@@ -85,22 +165,28 @@ def simulate_flask_startup():
                 print("SUCCESS: Flask server started successfully!")
                 time.sleep(1)  # Simulate brief run
                 return True
-                
+
         except Exception as e:
             error_msg = str(e).lower()
-            
+
             if "already in use" in error_msg or "bind" in error_msg:
                 print(f"WARNING: Port {flask_port} is in use (attempt {attempt})")
-                
+
                 if attempt < max_attempts:
                     wait_time = 5 + (attempt * 2)
                     print(f"Waiting {wait_time} seconds before retry...")
-                    
+
                     if wait_for_port_available(port=flask_port, max_wait_time=wait_time):
                         print(f"Port {flask_port} is available, retrying...")
                         continue
                     else:
-                        print(f"Port {flask_port} still not available, trying anyway...")
+                        # Last resort: scan alternate candidates in one batch
+                        alt = find_available_port(ports=[flask_port + i for i in range(1, 6)])
+                        if alt is not None:
+                            print(f"Port {flask_port} still busy, falling back to port {alt}")
+                            flask_port = alt
+                        else:
+                            print(f"Port {flask_port} still not available, trying anyway...")
                         continue
                 else:
                     print(f"FAILED: Could not start after {max_attempts} attempts")
@@ -108,82 +194,94 @@ def simulate_flask_startup():
             else:
                 print(f"ERROR: {e}")
                 return False
-    
+
     return False
 
-if __name__ == '__main__':
-    print("Testing Flask startup retry mechanism...")
-    success = simulate_flask_startup()
-    if success:
-        print("SUCCESS: Startup retry works!")
-        sys.exit(0)
-    else:
-        print("FAILED: Startup retry failed!")
-        sys.exit(1)
-"""
-    
-    # Test with temporary directory
-    with tempfile.TemporaryDirectory() as test_dir:
-        test_script_path = os.path.join(test_dir, "simple_test.py")
-        with open(test_script_path, 'w', encoding='utf-8') as f:
-            f.write(test_script)
-        
-        print(f"Created test script: {test_script_path}")
-        
-        # Test 1: Normal startup
-        print(f"\nTest 1: Normal startup")
-        try:
-            result = subprocess.run([sys.executable, test_script_path], 
-                                  capture_output=True, text=True, timeout=15)
-            print(f"Output:\n{result.stdout}")
-            if result.stderr:
-                print(f"Errors:\n{result.stderr}")
-            
-            test1_passed = result.returncode == 0
-            print(f"Test 1: {'PASSED' if test1_passed else 'FAILED'}")
-                
-        except Exception as e:
-            print(f"Test 1 FAILED: {e}")
-            test1_passed = False
-        
-        # Test 2: With port conflict
-        print(f"\nTest 2: Startup with port conflict")
-        
-        # Block port temporarily
-        blocker_thread = create_port_blocker(port=5000, duration=6)
-        time.sleep(1)  # Wait for blocker to start
-        
-        try:
-            result = subprocess.run([sys.executable, test_script_path], 
-                                  capture_output=True, text=True, timeout=25)
-            print(f"Output:\n{result.stdout}")
-            if result.stderr:
-                print(f"Errors:\n{result.stderr}")
-            
-            test2_passed = result.returncode == 0
-            print(f"Test 2: {'PASSED' if test2_passed else 'FAILED'}")
-                
-        except Exception as e:
-            print(f"Test 2 FAILED: {e}")
-            test2_passed = False
-        
-        return test1_passed and test2_passed
+def _simulate_flask_startup_child(queue):
+    """Child-process entry point: run the simulation, report output + result."""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            success = simulate_flask_startup()
+    except Exception as e:
+        buf.write(f"EXCEPTION: {e}\n")
+        success = False
+    queue.put(buf.getvalue())
+    sys.exit(0 if success else 1)
+
+def _run_startup_child(timeout):
+    """Run the simulation in a child process and return (passed, output).
+
+    spawn, not fork: a forked child would inherit the port blocker's
+    listening socket and hold the port against itself, so the conflict
+    test could never pass. spawn's fork+exec drops the (non-inheritable)
+    fd, and still beats writing a temp script and launching a fresh
+    interpreter for it.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_simulate_flask_startup_child, args=(queue,))
+    proc.start()
+    proc.join(timeout=timeout)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return False, "(timed out)"
+    output = queue.get() if not queue.empty() else ""
+    return proc.exitcode == 0, output
+
+def test_startup_retry():
+    """Test the startup retry mechanism"""
+    print("\n" + "="*60)
+    print("Testing Flask Startup Retry Mechanism")
+    print("="*60)
+
+    # Test 1: Normal startup
+    print(f"\nTest 1: Normal startup")
+    try:
+        test1_passed, output = _run_startup_child(timeout=15)
+        print(f"Output:\n{output}")
+        print(f"Test 1: {'PASSED' if test1_passed else 'FAILED'}")
+    except Exception as e:
+        print(f"Test 1 FAILED: {e}")
+        test1_passed = False
+
+    # Test 2: With port conflict - the port is already held when the
+    # child starts (no startup race), and a timer frees it mid-run so
+    # the retry path gets exercised
+    print(f"\nTest 2: Startup with port conflict")
+
+    try:
+        with port_blocked(5000) as blocker:
+            release_timer = threading.Timer(6, blocker.release)
+            release_timer.start()
+            try:
+                test2_passed, output = _run_startup_child(timeout=25)
+            finally:
+                release_timer.cancel()
+        print(f"Output:\n{output}")
+        print(f"Test 2: {'PASSED' if test2_passed else 'FAILED'}")
+    except Exception as e:
+        print(f"Test 2 FAILED: {e}")
+        test2_passed = False
+
+    return test1_passed and test2_passed
 
 if __name__ == '__main__':
     print("Starting Flask Startup Retry Test")
     print(f"OS: {'Windows' if os.name == 'nt' else 'Unix'}")
     print(f"Python: {sys.executable}")
-    
+
     test_passed = test_startup_retry()
-    
+
     print("\n" + "="*60)
     print("Test Results")
     print("="*60)
-    
+
     if test_passed:
         print("SUCCESS: Flask startup retry mechanism works!")
         print("The app should now handle port conflicts during startup.")
         sys.exit(0)
     else:
         print("FAILED: Issues with startup retry mechanism.")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
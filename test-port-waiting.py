@@ -5,6 +5,8 @@ Port Availability Test Script
 Tests the smart port waiting functionality for Flask auto-update restarts.
 """
 
+import random
+import signal
 import socket
 import time
 import threading
@@ -25,14 +27,22 @@ def is_port_available(host='localhost', port=5000, timeout=1):
     Returns:
         bool: True if port is available, False if in use
     """
+    # Phase 1: can we actually bind? This is the authoritative signal -
+    # a TIME_WAIT remnant refuses binds that a connect probe misreads
+    # as "available".
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            # If connection fails, port is available
-            return result != 0
-    except Exception:
-        # If any error occurs, assume port is available
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+            sock.listen(1)
+    except OSError:
+        return False
+    # Phase 2: confirm nobody answers now that our probe listener is gone
+    # (catches a racing process that bound between the two phases)
+    try:
+        with socket.create_connection((host, port), timeout=0.05):
+            return False
+    except (OSError, OverflowError):
         return True
 
 def wait_for_port_available(host='localhost', port=5000, max_wait_time=30, check_interval=0.5):
@@ -49,24 +59,33 @@ def wait_for_port_available(host='localhost', port=5000, max_wait_time=30, check
         bool: True if port became available, False if timeout reached
     """
     print(f"🔍 Waiting for port {port} to become available...")
-    start_time = time.time()
+    start = time.monotonic()
+    deadline = start + max_wait_time
     attempts = 0
-    
-    while time.time() - start_time < max_wait_time:
+
+    # There is no kernel event for "this port became bindable", so a wait
+    # has to probe - but the probe cadence can adapt: start at 10ms to
+    # catch fast releases, back off towards check_interval when the old
+    # listener is slow to die.
+    delay = 0.01
+    while time.monotonic() < deadline:
         attempts += 1
         if is_port_available(host, port):
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start
             print(f"✅ Port {port} is now available! (took {elapsed:.1f}s, {attempts} checks)")
             return True
-            
+
         # Print status updates every 2 seconds
-        if attempts % 4 == 0:  # Every 4 checks * 0.5s = 2s
-            elapsed = int(time.time() - start_time)
+        if attempts % 10 == 0:
+            elapsed = int(time.monotonic() - start)
             print(f"⏳ Still waiting for port {port}... ({elapsed}s elapsed, {attempts} checks)")
-            
-        time.sleep(check_interval)
-    
-    elapsed = time.time() - start_time
+
+        # Full jitter so concurrent waiters spread out instead of probing
+        # on the same tick
+        time.sleep(random.uniform(0, delay))
+        delay = min(delay * 1.5, check_interval)
+
+    elapsed = time.monotonic() - start
     print(f"❌ Timeout: Port {port} still not available after {elapsed:.1f}s ({attempts} checks)")
     return False
 
@@ -91,10 +110,16 @@ def test_flask_server(duration=10):
         print("🛑 Shutting down test Flask server...")
         # Force exit to simulate restart scenario
         os._exit(0)
-    
-    # Start shutdown timer
-    shutdown_thread = threading.Thread(target=shutdown_server, daemon=True)
-    shutdown_thread.start()
+
+    # Prefer a SIGALRM kernel timer over a sleeping thread; signal
+    # handlers can only be installed from the main thread, and Windows
+    # has no setitimer, so fall back to the thread in those cases
+    if hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGALRM, lambda *_: os._exit(0))
+        signal.setitimer(signal.ITIMER_REAL, duration)
+    else:
+        shutdown_thread = threading.Thread(target=shutdown_server, daemon=True)
+        shutdown_thread.start()
     
     try:
         socketio.run(app, host='localhost', port=5000, debug=False)
@@ -181,17 +206,16 @@ def is_port_available(host='localhost', port=5000, timeout=1):
         return True
 
 def wait_for_port_available(host='localhost', port=5000, max_wait_time=30, check_interval=0.5):
-    start_time = time.time()
+    deadline = time.monotonic() + max_wait_time
     attempts = 0
-    while time.time() - start_time < max_wait_time:
+    delay = 0.01
+    while time.monotonic() < deadline:
         attempts += 1
         if is_port_available(host, port):
             print(f'Port {port} is now available (checked {attempts} times)')
             return True
-        if attempts % 4 == 0:
-            elapsed = int(time.time() - start_time)
-            print(f'Still waiting for port {port}... ({elapsed}s elapsed)')
-        time.sleep(check_interval)
+        time.sleep(delay)
+        delay = min(delay * 1.5, check_interval)
     return False
 
 # Wait for port and then start new instance
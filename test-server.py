@@ -6,6 +6,9 @@ Run this instead of app.py to test the visual feedback system.
 
 from flask import Flask, Response
 from flask_socketio import SocketIO
+import os
+import selectors
+import sys
 import threading
 import time
 import random
@@ -13,95 +16,146 @@ import random
 app = Flask(__name__)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
-# Read the actual HTML file
-def get_html_content():
-    try:
-        with open('index.html', 'r', encoding='utf-8') as f:
-            return f.read()
-    except FileNotFoundError:
-        return "<h1>Error: index.html not found</h1>"
+# Fixed test payloads, built once at import; every emit reuses the same
+# dict instead of allocating a fresh literal per event
+_SUCCESS_PAYLOAD = {'message': 'Test card authorized'}
+_ERROR_PAYLOAD = {'message': 'Test card rejected'}
+_MANUAL_SUCCESS_PAYLOAD = {'message': 'Manual test - card authorized'}
+_MANUAL_ERROR_PAYLOAD = {'message': 'Manual test - card rejected'}
+
+# Read the actual HTML file once at startup: a test server never edits
+# it mid-run, and reconnect storms shouldn't re-read and re-decode the
+# file per request
+try:
+    with open('index.html', 'rb') as f:
+        _HTML_BYTES = f.read()
+except FileNotFoundError:
+    _HTML_BYTES = b"<h1>Error: index.html not found</h1>"
 
 @app.route('/')
 def index():
-    return Response(get_html_content(), mimetype='text/html')
+    return Response(_HTML_BYTES, mimetype='text/html')
 
 @app.route('/fetch_html')
 def fetch_html():
-    return Response(get_html_content(), mimetype='text/html')
+    return Response(_HTML_BYTES, mimetype='text/html')
 
-def simulate_events():
-    """Simulate various WebSocket events for testing"""
+def simulate_events(seed=None):
+    """Simulate various WebSocket events for testing.
+
+    Pass a seed to replay the exact same delay schedule, e.g. when
+    reproducing a timing-dependent client behaviour.
+    """
     time.sleep(2)  # Wait for initial connection
-    
+
     # Simulate connection established
     print("Simulating: WebSocket connected")
-    
+
     # Wait a bit, then simulate card events
     time.sleep(3)
-    
+
     events_sequence = [
         ("reload", "Simulating card detection (reload)"),
         ("card_success", "Simulating successful card authorization"),
         ("card_unauthorized", "Simulating unauthorized card"),
         ("reload", "Simulating another card detection"),
     ]
-    
-    for event, description in events_sequence:
+
+    # Delays drawn up front from a seedable RNG, and sleeps driven off
+    # monotonic deadlines so drift doesn't accumulate over the sequence
+    rng = random.Random(seed)
+    delays = [rng.uniform(3, 8) for _ in events_sequence]
+    next_deadline = time.monotonic()
+
+    for (event, description), delay in zip(events_sequence, delays):
         print(f"Sending: {description}")
         if event == "card_success":
-            socketio.emit('card_success', {'message': 'Test card authorized'})
+            socketio.emit('card_success', _SUCCESS_PAYLOAD)
         elif event == "card_unauthorized":
-            socketio.emit('card_unauthorized', {'message': 'Test card rejected'})
+            socketio.emit('card_unauthorized', _ERROR_PAYLOAD)
         elif event == "reload":
             socketio.emit('reload')
-        
-        # Random delay between events (3-8 seconds)
-        time.sleep(random.uniform(3, 8))
 
-def interactive_test():
-    """Interactive testing - send events based on user input"""
-    time.sleep(2)
+        next_deadline += delay
+        time.sleep(max(0.0, next_deadline - time.monotonic()))
+
+def _print_menu():
     print("\n=== Interactive WebSocket Event Tester ===")
     print("Commands:")
     print("  1 or success - Send card_success event")
-    print("  2 or error - Send card_unauthorized event") 
+    print("  2 or error - Send card_unauthorized event")
     print("  3 or reload - Send reload event")
     print("  4 or disconnect - Simulate disconnect")
     print("  5 or auto - Start automatic event simulation")
     print("  6 or timeout - Test connection timeout (stop server for 15s)")
     print("  q or quit - Exit")
     print("==========================================\n")
-    
+
+
+def _handle_command(cmd):
+    """Run one tester command; returns False when the tester should exit."""
+    if cmd in ['q', 'quit']:
+        return False
+    elif cmd in ['1', 'success']:
+        print("Sending card_success event")
+        socketio.emit('card_success', _MANUAL_SUCCESS_PAYLOAD)
+    elif cmd in ['2', 'error']:
+        print("Sending card_unauthorized event")
+        socketio.emit('card_unauthorized', _MANUAL_ERROR_PAYLOAD)
+    elif cmd in ['3', 'reload']:
+        print("Sending reload event")
+        socketio.emit('reload')
+    elif cmd in ['4', 'disconnect']:
+        print("Note: Disconnect is handled by browser, not server")
+        print("Try closing/refreshing the browser tab to see disconnect event")
+    elif cmd in ['5', 'auto']:
+        print("Starting automatic event simulation...")
+        threading.Thread(target=simulate_events, daemon=True).start()
+    elif cmd in ['6', 'timeout']:
+        print("Testing connection timeout - server will pause for 15 seconds...")
+        print("Watch the browser for connection failure effects!")
+        socketio.stop()
+        time.sleep(15)
+        print("Resuming server...")
+    else:
+        print("Unknown command. Try 1, 2, 3, 4, 5, 6, or q")
+    return True
+
+
+def interactive_test_poll():
+    """Cooperative stdin tester: polls stdin via selectors instead of
+    parking a dedicated thread in a blocking input() call."""
+    socketio.sleep(2)
+    _print_menu()
+    sel = selectors.DefaultSelector()
+    sel.register(sys.stdin, selectors.EVENT_READ)
+    print("Enter command: ", end="", flush=True)
+    try:
+        while True:
+            if sel.select(timeout=0.1):
+                line = sys.stdin.readline()
+                if not line:  # EOF
+                    break
+                if not _handle_command(line.strip().lower()):
+                    break
+                print("Enter command: ", end="", flush=True)
+            else:
+                socketio.sleep(0)  # yield to the server between polls
+    except KeyboardInterrupt:
+        print("\nExiting...")
+    finally:
+        sel.close()
+
+
+def interactive_test():
+    """Blocking-input tester, kept for platforms where selectors cannot
+    wait on stdin (Windows)."""
+    time.sleep(2)
+    _print_menu()
     while True:
         try:
-            cmd = input("Enter command: ").strip().lower()
-            
-            if cmd in ['q', 'quit']:
+            if not _handle_command(input("Enter command: ").strip().lower()):
                 break
-            elif cmd in ['1', 'success']:
-                print("Sending card_success event")
-                socketio.emit('card_success', {'message': 'Manual test - card authorized'})
-            elif cmd in ['2', 'error']:
-                print("Sending card_unauthorized event")
-                socketio.emit('card_unauthorized', {'message': 'Manual test - card rejected'})
-            elif cmd in ['3', 'reload']:
-                print("Sending reload event")
-                socketio.emit('reload')
-            elif cmd in ['4', 'disconnect']:
-                print("Note: Disconnect is handled by browser, not server")
-                print("Try closing/refreshing the browser tab to see disconnect event")
-            elif cmd in ['5', 'auto']:
-                print("Starting automatic event simulation...")
-                threading.Thread(target=simulate_events, daemon=True).start()
-            elif cmd in ['6', 'timeout']:
-                print("Testing connection timeout - server will pause for 15 seconds...")
-                print("Watch the browser for connection failure effects!")
-                socketio.stop()
-                time.sleep(15)
-                print("Resuming server...")
-            else:
-                print("Unknown command. Try 1, 2, 3, 4, 5, 6, or q")
-                
         except KeyboardInterrupt:
             print("\nExiting...")
             break
@@ -121,8 +175,12 @@ if __name__ == '__main__':
     print("Open http://localhost:5000 in your browser")
     print("The server will start interactive testing mode in 2 seconds...")
     
-    # Start interactive testing in a separate thread
-    threading.Thread(target=interactive_test, daemon=True).start()
+    # Interactive testing: cooperative stdin polling where select() works
+    # on stdin, a dedicated input() thread on Windows
+    if os.name == 'nt':
+        threading.Thread(target=interactive_test, daemon=True).start()
+    else:
+        socketio.start_background_task(interactive_test_poll)
     
     # Run the Flask-SocketIO server
     socketio.run(app, host='0.0.0.0', port=5000, allow_unsafe_werkzeug=True, debug=False)
\ No newline at end of file
@@ -27,7 +27,7 @@ def try_import_app_helpers():
         import app
         return app
     except Exception as e:
-        logger.error(f"Failed to import app: {e}")
+        logger.error("Failed to import app: %s", e)
         return None
 
 
@@ -36,7 +36,7 @@ def try_import_main_reader():
         import main
         return main
     except Exception as e:
-        logger.debug(f"Could not import main reader implementation: {e}")
+        logger.debug("Could not import main reader implementation: %s", e)
         return None
 
 
@@ -45,7 +45,7 @@ def try_import_libnfc_reader():
         import libnfc
         return libnfc
     except Exception as e:
-        logger.debug(f"Could not import libnfc reader implementation: {e}")
+        logger.debug("Could not import libnfc reader implementation: %s", e)
         return None
 
 
@@ -55,7 +55,7 @@ def try_import_nfcpy():
         from nfc import ContactlessFrontend
         return nfc, ContactlessFrontend
     except Exception as e:
-        logger.debug(f"Could not import nfcpy module: {e}")
+        logger.debug("Could not import nfcpy module: %s", e)
         return None, None
 
 
@@ -76,60 +76,74 @@ def main_run(args):
     try:
         ok = appmod.test_nfc_reader_availability()
     except Exception as e:
-        logger.warning(f"test_nfc_reader_availability() raised exception: {e}")
+        logger.warning("test_nfc_reader_availability() raised exception: %s", e)
 
-    logger.info(f"NFC reader available (app.test_nfc_reader_availability): {ok}")
+    logger.info("NFC reader available (app.test_nfc_reader_availability): %s", ok)
 
     if args.attempts <= 0:
         logger.info("No attempts requested; exiting")
         return 0
 
+    # Resolve the optional reader entry points once; the loop body then
+    # does a None check and a direct call instead of re-running hasattr
+    # machinery on every attempt
+    read_uid = appmod.try_connect_and_get_uid
+    main_read = getattr(mainmod, 'read_card_once', None) if mainmod else None
+    main_read_fallback = getattr(mainmod, 'try_read_uid', None) if mainmod else None
+    libnfc_read = None
+    if libnfcmod is not None and hasattr(libnfcmod, 'on_connect_read_uid'):
+        libnfc_read = getattr(libnfcmod, 'read_uid_once', None)
+
+    # Level check cached once: the per-attempt debug lines are skipped
+    # entirely when --verbose is off instead of re-asking the logger
+    _debug_on = logger.isEnabledFor(logging.DEBUG)
+
     found_any = False
     start_time = time.time()
 
     for attempt in range(1, args.attempts + 1):
         try:
-            uid = appmod.try_connect_and_get_uid()
+            uid = read_uid()
             if uid:
                 # Print human-readable UID
-                logger.info(f"Attempt {attempt}/{args.attempts}: UID read: {uid}")
+                logger.info("Attempt %s/%s: UID read: %s", attempt, args.attempts, uid)
                 found_any = True
             else:
-                logger.info(f"Attempt {attempt}/{args.attempts}: No card present")
+                logger.info("Attempt %s/%s: No card present", attempt, args.attempts)
         except Exception as e:
-            logger.error(f"Attempt {attempt} error: {e}")
+            logger.error("Attempt %s error: %s", attempt, e)
 
         # Optionally check alternative readers (main.py and libnfc.py) without interfering
-        if mainmod and hasattr(mainmod, 'read_card_once'):
+        if main_read is not None:
             try:
                 # Some main.py variants use different function names; this is a best effort
                 res = None
                 try:
-                    res = mainmod.read_card_once()
+                    res = main_read()
                 except Exception:
                     # try a generic name used in some impls
-                    if hasattr(mainmod, 'try_read_uid'):
-                        res = mainmod.try_read_uid()
+                    if main_read_fallback is not None:
+                        res = main_read_fallback()
                 if res:
-                    logger.info(f"Attempt {attempt}: main.py read: {res}")
-                else:
-                    logger.debug(f"Attempt {attempt}: main.py did not read card")
+                    logger.info("Attempt %s: main.py read: %s", attempt, res)
+                elif _debug_on:
+                    logger.debug("Attempt %s: main.py did not read card", attempt)
             except Exception as e:
-                logger.debug(f"Attempt {attempt} main.py read error: {e}")
+                if _debug_on:
+                    logger.debug("Attempt %s main.py read error: %s", attempt, e)
 
-        if libnfcmod and hasattr(libnfcmod, 'on_connect_read_uid'):
+        if libnfc_read is not None:
             try:
                 # libnfc variants sometimes expect callback flows - do a safe probe only
-                res = None
-                if hasattr(libnfcmod, 'read_uid_once'):
-                    try:
-                        res = libnfcmod.read_uid_once()
-                    except Exception:
-                        res = None
+                try:
+                    res = libnfc_read()
+                except Exception:
+                    res = None
                 if res:
-                    logger.info(f"Attempt {attempt}: libnfc reader returned: {res}")
+                    logger.info("Attempt %s: libnfc reader returned: %s", attempt, res)
             except Exception as e:
-                logger.debug(f"Attempt {attempt} libnfc read error: {e}")
+                if _debug_on:
+                    logger.debug("Attempt %s libnfc read error: %s", attempt, e)
 
         # nfcpy detection: try to construct ContactlessFrontend and optionally read if enabled
         if nfcpy_cf is not None:
@@ -144,7 +158,7 @@ def main_run(args):
                     except Exception:
                         clf = None
                 if clf:
-                    logger.info(f"Attempt {attempt}: nfcpy ContactlessFrontend opened: {clf}")
+                    logger.info("Attempt %s: nfcpy ContactlessFrontend opened: %s", attempt, clf)
                     if nfcpy_enabled:
                         # Attempt a non-blocking read using rdwr with a terminate timeout
                         uid_container = {'uid': None}
@@ -164,26 +178,27 @@ def main_run(args):
                         except Exception:
                             pass
                         if uid_container['uid']:
-                            logger.info(f"Attempt {attempt}: nfcpy read UID: {uid_container['uid']}")
+                            logger.info("Attempt %s: nfcpy read UID: %s", attempt, uid_container['uid'])
                     try:
                         clf.close()
                     except Exception:
                         pass
-                else:
-                    logger.debug(f"Attempt {attempt}: nfcpy did not find a reader")
+                elif _debug_on:
+                    logger.debug("Attempt %s: nfcpy did not find a reader", attempt)
             except Exception as e:
-                logger.debug(f"Attempt {attempt} nfcpy detection error: {e}")
+                if _debug_on:
+                    logger.debug("Attempt %s nfcpy detection error: %s", attempt, e)
 
         time.sleep(args.interval)
 
     total_elapsed = time.time() - start_time
-    logger.info(f"Finished {args.attempts} attempts in {total_elapsed:.1f}s; found any: {found_any}")
+    logger.info("Finished %s attempts in %.1fs; found any: %s", args.attempts, total_elapsed, found_any)
 
     # Cleanup
     try:
         appmod.cleanup_nfc_reader()
     except Exception as e:
-        logger.debug(f"Error while trying to cleanup readers: {e}")
+        logger.debug("Error while trying to cleanup readers: %s", e)
 
     return 0
 